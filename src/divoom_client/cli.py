@@ -1,29 +1,59 @@
 """CLI for divoom_client."""
 
+import argparse
+import functools
 import json
 import logging
+import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from dotenv import load_dotenv
-import typer
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None  # type: ignore[assignment]
 
 # Load environment variables from .env file
 load_dotenv()
 
 from divoom_client import __version__
-from divoom_client.core.discovery import discover_device, get_device, scan_network
-from divoom_client.core.frame import Frame
-from divoom_client.core.pixoo import Pixoo
-from divoom_client.core.renderer import Renderer
-from divoom_client.models.layout import Layout
-
-app = typer.Typer(
-    name="divoom",
-    help="Divoom Pixoo 64 display manager",
-    no_args_is_help=True,
-)
+
+if TYPE_CHECKING:
+    from divoom_client.core.frame import Frame
+    from divoom_client.core.pixoo import Pixoo
+    from divoom_client.datasources.manager import DataSourceManager
+    from divoom_client.models.layout import Layout
+
+# Top-level help is a constant so `divoom --help` never builds any parsers
+_HELP = """\
+Usage: divoom [OPTIONS] COMMAND [ARGS]...
+
+  Divoom Pixoo 64 display manager.
+
+Options:
+  -v, --verbose  Enable verbose output
+  -h, --help     Show this message and exit.
+
+Commands:
+  version     Show version information.
+  discover    Discover Pixoo devices on the network.
+  test        Test connection to Pixoo device.
+  brightness  Set display brightness.
+  clear       Clear the display with a solid color.
+  on          Turn display on.
+  off         Turn display off.
+  render      Render a layout and send to device or save as image.
+  live        Fetch live data and render a layout.
+  fetch       Fetch data from configured data sources.
+  demo        Render a demo frame to test the display.
+  serve       Start the display manager with scheduled updates.
+  status      Show status of data sources and configuration.
+
+Run 'divoom COMMAND --help' for more information on a command.
+"""
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -35,377 +65,476 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
-@app.callback()
-def main(
-    ctx: typer.Context,
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output"),
-) -> None:
-    """Divoom Pixoo 64 display manager."""
-    setup_logging(verbose)
-    ctx.ensure_object(dict)
-    ctx.obj["verbose"] = verbose
+def _error(message: str) -> None:
+    """Print a message to stderr."""
+    print(message, file=sys.stderr)
 
 
-@app.command()
-def version() -> None:
-    """Show version information."""
-    typer.echo(f"divoom-client v{__version__}")
+def _parser(name: str, description: str) -> argparse.ArgumentParser:
+    """Create the argument parser for a single command."""
+    return argparse.ArgumentParser(prog=f"divoom {name}", description=description)
 
 
-@app.command()
-def discover(
-    config_dir: Path = typer.Option(
-        Path("config"),
+def _add_ip_option(
+    parser: argparse.ArgumentParser,
+    help: str = "IP address of Pixoo device",
+) -> None:
+    parser.add_argument("--ip", default=None, help=help)
+
+
+def _add_config_dir_option(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--config-dir", "-c",
+        type=Path,
+        default=Path("config"),
         help="Path to config directory",
-    ),
-) -> None:
+    )
+
+
+def _add_assets_option(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--assets", "-a",
+        dest="assets_dir",
+        type=Path,
+        default=Path("assets"),
+        help="Assets directory",
+    )
+
+
+def _brightness_level(value: str) -> int:
+    """Argument type for brightness levels (0-100)."""
+    try:
+        level = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value!r} is not a valid integer")
+    if not 0 <= level <= 100:
+        raise argparse.ArgumentTypeError(f"{level} is not in the range 0<=x<=100")
+    return level
+
+
+@functools.lru_cache(maxsize=32)
+def _load_json_cached(path_str: str, mtime_ns: int) -> Any:
+    """Parse a JSON file, cached per (path, mtime) so edits invalidate it."""
+    with open(path_str) as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_layout_cached(path_str: str, mtime_ns: int) -> "Layout":
+    """Parse and validate a layout file, cached per (path, mtime)."""
+    from divoom_client.models.layout import Layout
+
+    return Layout.model_validate(_load_json_cached(path_str, mtime_ns))
+
+
+def _dumps_json(data: Any) -> bytes:
+    """Pretty-print data as JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(data, indent=2, default=str).encode()
+
+
+def _load_json(path: Path) -> Any:
+    """Load a JSON file through the mtime-keyed cache."""
+    return _load_json_cached(str(path), path.stat().st_mtime_ns)
+
+
+def _load_layout(path: Path) -> "Layout":
+    """Load a validated layout through the mtime-keyed cache."""
+    return _load_layout_cached(str(path), path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_manager_cached(path_str: str, mtime_ns: Optional[int]) -> "DataSourceManager":
+    """Build a data source manager for a datasources.json, cached per (path, mtime)."""
+    from divoom_client.datasources.manager import DataSourceManager
+
+    manager = DataSourceManager()
+    if mtime_ns is not None:
+        manager.load_config(Path(path_str))
+    return manager
+
+
+def _get_manager(config_dir: Path) -> "DataSourceManager":
+    """Get the data source manager for a config directory.
+
+    The manager is built once per datasources.json and rebuilt when the file
+    changes. An empty manager is returned if the file does not exist.
+    """
+    path = config_dir / "datasources.json"
+    try:
+        mtime_ns: Optional[int] = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None
+    return _get_manager_cached(str(path), mtime_ns)
+
+
+def _load_layout_or_exit(layout_file: Path) -> "Layout":
+    """Load a layout through the cache, exiting with an error if it is unusable."""
+    if not layout_file.exists():
+        _error(f"Layout file not found: {layout_file}")
+        sys.exit(1)
+
+    try:
+        return _load_layout(layout_file)
+    except (json.JSONDecodeError, ValueError) as e:
+        _error(f"Invalid layout file: {e}")
+        sys.exit(1)
+
+
+def _render_layout(layout: "Layout", data: dict[str, Any], assets_dir: Path) -> "Frame":
+    """Render a layout with a data context."""
+    from divoom_client.core.renderer import Renderer
+
+    renderer = Renderer(assets_dir=assets_dir)
+    print(f"Rendering layout: {layout.name}")
+    return renderer.render(layout, data)
+
+
+def _connect_or_exit(ip: Optional[str], config_dir: Path) -> "Pixoo":
+    """Connect to the given or discovered device, exiting if none is found."""
+    from divoom_client.core.discovery import get_device
+    from divoom_client.core.pixoo import Pixoo
+
+    device = Pixoo(ip) if ip else get_device(config_dir)
+    if device is None:
+        _error("No device found. Use --output to save as image instead.")
+        sys.exit(1)
+    return device
+
+
+def _deliver(frame: "Frame", output: Optional[Path], ip: Optional[str], config_dir: Path) -> None:
+    """Save a rendered frame to an image file, or send it to the device."""
+    if output:
+        frame.save(str(output))
+        print(f"Saved to {output}")
+    else:
+        device = _connect_or_exit(ip, config_dir)
+        device.send_rgb_bytes(frame.to_bytes())
+        print(f"Sent to device at {device.ip_address}")
+
+
+def _cmd_version(argv: list[str]) -> None:
+    """Show version information."""
+    if argv:
+        _parser("version", "Show version information.").parse_args(argv)
+    print(f"divoom-client v{__version__}")
+
+
+def _cmd_discover(argv: list[str]) -> None:
     """Discover Pixoo devices on the network."""
-    typer.echo("Scanning network for Pixoo devices...")
+    from divoom_client.core.discovery import scan_network
+
+    parser = _parser("discover", "Discover Pixoo devices on the network.")
+    _add_config_dir_option(parser)
+    parser.parse_args(argv)
+
+    print("Scanning network for Pixoo devices...")
 
     devices = scan_network()
 
     if devices:
-        typer.echo(f"\nFound {len(devices)} device(s):")
+        print(f"\nFound {len(devices)} device(s):")
         for ip in devices:
-            typer.echo(f"  - {ip}")
+            print(f"  - {ip}")
     else:
-        typer.echo("\nNo devices found.")
-        typer.echo("Make sure your Pixoo is powered on and connected to the same network.")
-
-
-@app.command()
-def test(
-    ip: Optional[str] = typer.Option(
-        None,
-        "--ip",
-        help="IP address of Pixoo device (auto-discover if not specified)",
-    ),
-    config_dir: Path = typer.Option(
-        Path("config"),
-        "--config-dir", "-c",
-        help="Path to config directory",
-    ),
-) -> None:
+        print("\nNo devices found.")
+        print("Make sure your Pixoo is powered on and connected to the same network.")
+
+
+def _cmd_test(argv: list[str]) -> None:
     """Test connection to Pixoo device."""
-    if ip:
-        typer.echo(f"Testing connection to {ip}...")
-        device = Pixoo(ip)
+    from divoom_client.core.discovery import get_device
+    from divoom_client.core.pixoo import Pixoo
+
+    parser = _parser("test", "Test connection to Pixoo device.")
+    _add_ip_option(parser, "IP address of Pixoo device (auto-discover if not specified)")
+    _add_config_dir_option(parser)
+    args = parser.parse_args(argv)
+
+    if args.ip:
+        print(f"Testing connection to {args.ip}...")
+        device: Optional[Pixoo] = Pixoo(args.ip)
     else:
-        typer.echo("Discovering device...")
-        device = get_device(config_dir)
+        print("Discovering device...")
+        device = get_device(args.config_dir)
 
     if device is None:
-        typer.echo("No device found.", err=True)
-        raise typer.Exit(1)
+        _error("No device found.")
+        sys.exit(1)
 
     if device.ping():
-        typer.echo(f"Successfully connected to Pixoo at {device.ip_address}")
+        print(f"Successfully connected to Pixoo at {device.ip_address}")
 
         try:
             info = device.get_device_info()
-            typer.echo(f"  Device ID: {info.get('DeviceId', 'unknown')}")
-            typer.echo(f"  Brightness: {info.get('Brightness', 'unknown')}%")
+            print(f"  Device ID: {info.get('DeviceId', 'unknown')}")
+            print(f"  Brightness: {info.get('Brightness', 'unknown')}%")
         except Exception as e:
-            typer.echo(f"  (Could not get device info: {e})")
+            print(f"  (Could not get device info: {e})")
     else:
-        typer.echo(f"Failed to connect to {device.ip_address}", err=True)
-        raise typer.Exit(1)
+        _error(f"Failed to connect to {device.ip_address}")
+        sys.exit(1)
 
 
-@app.command()
-def brightness(
-    level: int = typer.Argument(..., min=0, max=100, help="Brightness level (0-100)"),
-    ip: Optional[str] = typer.Option(None, "--ip", help="IP address of Pixoo device"),
-    config_dir: Path = typer.Option(Path("config"), "--config-dir", "-c"),
-) -> None:
+def _cmd_brightness(argv: list[str]) -> None:
     """Set display brightness."""
-    if ip:
-        device = Pixoo(ip)
+    from divoom_client.core.discovery import get_device
+    from divoom_client.core.pixoo import Pixoo
+
+    parser = _parser("brightness", "Set display brightness.")
+    parser.add_argument("level", type=_brightness_level, help="Brightness level (0-100)")
+    _add_ip_option(parser)
+    _add_config_dir_option(parser)
+    args = parser.parse_args(argv)
+
+    if args.ip:
+        device: Optional[Pixoo] = Pixoo(args.ip)
     else:
-        device = get_device(config_dir)
+        device = get_device(args.config_dir)
 
     if device is None:
-        typer.echo("No device found.", err=True)
-        raise typer.Exit(1)
+        _error("No device found.")
+        sys.exit(1)
 
-    device.set_brightness(level)
-    typer.echo(f"Brightness set to {level}%")
+    device.set_brightness(args.level)
+    print(f"Brightness set to {args.level}%")
 
 
-@app.command()
-def clear(
-    color: str = typer.Option("#000000", "--color", help="Fill color (hex)"),
-    ip: Optional[str] = typer.Option(None, "--ip", help="IP address of Pixoo device"),
-    config_dir: Path = typer.Option(Path("config"), "--config-dir", "-c"),
-) -> None:
+def _cmd_clear(argv: list[str]) -> None:
     """Clear the display with a solid color."""
-    if ip:
-        device = Pixoo(ip)
+    from divoom_client.core.discovery import get_device
+    from divoom_client.core.pixoo import Pixoo
+
+    parser = _parser("clear", "Clear the display with a solid color.")
+    parser.add_argument("--color", default="#000000", help="Fill color (hex)")
+    _add_ip_option(parser)
+    _add_config_dir_option(parser)
+    args = parser.parse_args(argv)
+
+    if args.ip:
+        device: Optional[Pixoo] = Pixoo(args.ip)
     else:
-        device = get_device(config_dir)
+        device = get_device(args.config_dir)
 
     if device is None:
-        typer.echo("No device found.", err=True)
-        raise typer.Exit(1)
+        _error("No device found.")
+        sys.exit(1)
 
-    color = color.lstrip("#")
+    color = args.color.lstrip("#")
     r = int(color[0:2], 16)
     g = int(color[2:4], 16)
     b = int(color[4:6], 16)
 
     device.clear((r, g, b))
-    typer.echo(f"Display cleared with color #{color}")
+    print(f"Display cleared with color #{color}")
 
 
-@app.command()
-def on(
-    ip: Optional[str] = typer.Option(None, "--ip", help="IP address of Pixoo device"),
-    config_dir: Path = typer.Option(Path("config"), "--config-dir", "-c"),
-) -> None:
+def _cmd_on(argv: list[str]) -> None:
     """Turn display on."""
-    if ip:
-        device = Pixoo(ip)
+    from divoom_client.core.discovery import get_device
+    from divoom_client.core.pixoo import Pixoo
+
+    parser = _parser("on", "Turn display on.")
+    _add_ip_option(parser)
+    _add_config_dir_option(parser)
+    args = parser.parse_args(argv)
+
+    if args.ip:
+        device: Optional[Pixoo] = Pixoo(args.ip)
     else:
-        device = get_device(config_dir)
+        device = get_device(args.config_dir)
 
     if device is None:
-        typer.echo("No device found.", err=True)
-        raise typer.Exit(1)
+        _error("No device found.")
+        sys.exit(1)
 
     device.set_screen_on(True)
-    typer.echo("Display turned on")
+    print("Display turned on")
 
 
-@app.command()
-def off(
-    ip: Optional[str] = typer.Option(None, "--ip", help="IP address of Pixoo device"),
-    config_dir: Path = typer.Option(Path("config"), "--config-dir", "-c"),
-) -> None:
+def _cmd_off(argv: list[str]) -> None:
     """Turn display off."""
-    if ip:
-        device = Pixoo(ip)
+    from divoom_client.core.discovery import get_device
+    from divoom_client.core.pixoo import Pixoo
+
+    parser = _parser("off", "Turn display off.")
+    _add_ip_option(parser)
+    _add_config_dir_option(parser)
+    args = parser.parse_args(argv)
+
+    if args.ip:
+        device: Optional[Pixoo] = Pixoo(args.ip)
     else:
-        device = get_device(config_dir)
+        device = get_device(args.config_dir)
 
     if device is None:
-        typer.echo("No device found.", err=True)
-        raise typer.Exit(1)
+        _error("No device found.")
+        sys.exit(1)
 
     device.set_screen_on(False)
-    typer.echo("Display turned off")
+    print("Display turned off")
 
 
-@app.command()
-def render(
-    layout_file: Path = typer.Argument(..., help="Path to layout JSON file"),
-    output: Optional[Path] = typer.Option(
-        None,
+def _cmd_render(argv: list[str]) -> None:
+    """Render a layout and send to device or save as image."""
+    parser = _parser("render", "Render a layout and send to device or save as image.")
+    parser.add_argument("layout_file", type=Path, help="Path to layout JSON file")
+    parser.add_argument(
         "--output", "-o",
+        type=Path,
+        default=None,
         help="Save rendered frame to image file instead of sending to device",
-    ),
-    data_file: Optional[Path] = typer.Option(
-        None,
+    )
+    parser.add_argument(
         "--data", "-d",
+        dest="data_file",
+        type=Path,
+        default=None,
         help="JSON file with data context for dynamic content",
-    ),
-    ip: Optional[str] = typer.Option(None, "--ip", help="IP address of Pixoo device"),
-    config_dir: Path = typer.Option(Path("config"), "--config-dir", "-c"),
-    assets_dir: Path = typer.Option(Path("assets"), "--assets", "-a", help="Assets directory"),
-) -> None:
-    """Render a layout and send to device or save as image."""
-    # Load layout
-    if not layout_file.exists():
-        typer.echo(f"Layout file not found: {layout_file}", err=True)
-        raise typer.Exit(1)
+    )
+    _add_ip_option(parser)
+    _add_config_dir_option(parser)
+    _add_assets_option(parser)
+    args = parser.parse_args(argv)
 
-    try:
-        with open(layout_file) as f:
-            layout_data = json.load(f)
-        layout = Layout.model_validate(layout_data)
-    except (json.JSONDecodeError, ValueError) as e:
-        typer.echo(f"Invalid layout file: {e}", err=True)
-        raise typer.Exit(1)
+    layout = _load_layout_or_exit(args.layout_file)
 
     # Load data context if provided
     data: dict = {}
+    data_file: Optional[Path] = args.data_file
     if data_file:
         if not data_file.exists():
-            typer.echo(f"Data file not found: {data_file}", err=True)
-            raise typer.Exit(1)
+            _error(f"Data file not found: {data_file}")
+            sys.exit(1)
         try:
-            with open(data_file) as f:
-                data = json.load(f)
+            data = _load_json(data_file)
         except json.JSONDecodeError as e:
-            typer.echo(f"Invalid data file: {e}", err=True)
-            raise typer.Exit(1)
+            _error(f"Invalid data file: {e}")
+            sys.exit(1)
 
-    # Render layout
-    renderer = Renderer(assets_dir=assets_dir)
-    typer.echo(f"Rendering layout: {layout.name}")
-    frame = renderer.render(layout, data)
+    frame = _render_layout(layout, data, args.assets_dir)
+    _deliver(frame, args.output, args.ip, args.config_dir)
 
-    # Output
-    if output:
-        frame.save(str(output))
-        typer.echo(f"Saved to {output}")
-    else:
-        # Send to device
-        if ip:
-            device = Pixoo(ip)
-        else:
-            device = get_device(config_dir)
-
-        if device is None:
-            typer.echo("No device found. Use --output to save as image instead.", err=True)
-            raise typer.Exit(1)
 
-        device.send_pixels(frame.to_pixels())
-        typer.echo(f"Sent to device at {device.ip_address}")
-
-
-@app.command()
-def live(
-    layout_file: Path = typer.Argument(..., help="Path to layout JSON file"),
-    output: Optional[Path] = typer.Option(
-        None,
-        "--output", "-o",
-        help="Save rendered frame to image file instead of sending to device",
-    ),
-    ip: Optional[str] = typer.Option(None, "--ip", help="IP address of Pixoo device"),
-    config_dir: Path = typer.Option(Path("config"), "--config-dir", "-c"),
-    assets_dir: Path = typer.Option(Path("assets"), "--assets", "-a", help="Assets directory"),
-) -> None:
+def _cmd_live(argv: list[str]) -> None:
     """Fetch live data and render a layout."""
     import asyncio
-    from divoom_client.datasources.manager import DataSourceManager
 
-    # Load layout
-    if not layout_file.exists():
-        typer.echo(f"Layout file not found: {layout_file}", err=True)
-        raise typer.Exit(1)
+    parser = _parser("live", "Fetch live data and render a layout.")
+    parser.add_argument("layout_file", type=Path, help="Path to layout JSON file")
+    parser.add_argument(
+        "--output", "-o",
+        type=Path,
+        default=None,
+        help="Save rendered frame to image file instead of sending to device",
+    )
+    _add_ip_option(parser)
+    _add_config_dir_option(parser)
+    _add_assets_option(parser)
+    args = parser.parse_args(argv)
 
-    try:
-        with open(layout_file) as f:
-            layout_data = json.load(f)
-        layout = Layout.model_validate(layout_data)
-    except (json.JSONDecodeError, ValueError) as e:
-        typer.echo(f"Invalid layout file: {e}", err=True)
-        raise typer.Exit(1)
+    layout = _load_layout_or_exit(args.layout_file)
 
     # Load data sources
-    manager = DataSourceManager()
-    datasources_config = config_dir / "datasources.json"
-
-    if datasources_config.exists():
-        manager.load_config(datasources_config)
+    manager = _get_manager(args.config_dir)
 
     # Fetch data
     if manager.sources:
-        typer.echo(f"Fetching data from {len(manager.sources)} source(s)...")
+        print(f"Fetching data from {len(manager.sources)} source(s)...")
         data = asyncio.run(manager.refresh_all())
     else:
-        typer.echo("No data sources configured, using empty data context")
+        print("No data sources configured, using empty data context")
         data = {}
 
-    # Render layout
-    renderer = Renderer(assets_dir=assets_dir)
-    typer.echo(f"Rendering layout: {layout.name}")
-    frame = renderer.render(layout, data)
-
-    # Output
-    if output:
-        frame.save(str(output))
-        typer.echo(f"Saved to {output}")
-    else:
-        # Send to device
-        if ip:
-            device = Pixoo(ip)
-        else:
-            device = get_device(config_dir)
-
-        if device is None:
-            typer.echo("No device found. Use --output to save as image instead.", err=True)
-            raise typer.Exit(1)
+    frame = _render_layout(layout, data, args.assets_dir)
+    _deliver(frame, args.output, args.ip, args.config_dir)
 
-        device.send_pixels(frame.to_pixels())
-        typer.echo(f"Sent to device at {device.ip_address}")
 
+def _cmd_fetch(argv: list[str]) -> None:
+    """Fetch data from configured data sources."""
+    import asyncio
 
-@app.command()
-def fetch(
-    source: Optional[str] = typer.Argument(
-        None,
+    parser = _parser("fetch", "Fetch data from configured data sources.")
+    parser.add_argument(
+        "source",
+        nargs="?",
+        default=None,
         help="Specific data source to fetch (or 'all' for all sources)",
-    ),
-    config_dir: Path = typer.Option(Path("config"), "--config-dir", "-c"),
-    output: Optional[Path] = typer.Option(
-        None,
+    )
+    _add_config_dir_option(parser)
+    parser.add_argument(
         "--output", "-o",
+        type=Path,
+        default=None,
         help="Save fetched data to JSON file",
-    ),
-) -> None:
-    """Fetch data from configured data sources."""
-    import asyncio
-    from divoom_client.datasources.manager import DataSourceManager
+    )
+    args = parser.parse_args(argv)
+    source: Optional[str] = args.source
 
-    manager = DataSourceManager()
-    datasources_config = config_dir / "datasources.json"
+    datasources_config = args.config_dir / "datasources.json"
 
     if not datasources_config.exists():
-        typer.echo(f"Data sources config not found: {datasources_config}", err=True)
-        typer.echo("Create config/datasources.json to configure data sources.")
-        raise typer.Exit(1)
+        _error(f"Data sources config not found: {datasources_config}")
+        print("Create config/datasources.json to configure data sources.")
+        sys.exit(1)
 
-    manager.load_config(datasources_config)
+    manager = _get_manager(args.config_dir)
 
     if not manager.sources:
-        typer.echo("No data sources configured.", err=True)
-        raise typer.Exit(1)
+        _error("No data sources configured.")
+        sys.exit(1)
+
+    if source and source != "all" and source not in manager.sources:
+        _error(f"Unknown data source: {source}")
+        print(f"Available sources: {list(manager.sources.keys())}")
+        sys.exit(1)
 
     async def do_fetch() -> dict:
         if source and source != "all":
-            if source not in manager.sources:
-                typer.echo(f"Unknown data source: {source}", err=True)
-                typer.echo(f"Available sources: {list(manager.sources.keys())}")
-                raise typer.Exit(1)
             try:
                 data = await manager.refresh(source)
                 return {source: data}
             except Exception as e:
-                typer.echo(f"ERROR: Failed to fetch {source}: {e}", err=True)
+                _error(f"ERROR: Failed to fetch {source}: {e}")
                 return {}
         else:
             return await manager.refresh_all()
 
-    typer.echo(f"Fetching data from {len(manager.sources)} source(s)...")
+    print(f"Fetching data from {len(manager.sources)} source(s)...")
     try:
         data = asyncio.run(do_fetch())
     except Exception as e:
-        typer.echo(f"ERROR: Fetch failed: {e}", err=True)
-        raise typer.Exit(1)
+        _error(f"ERROR: Fetch failed: {e}")
+        sys.exit(1)
 
-    if output:
-        with open(output, "w") as f:
-            json.dump(data, f, indent=2, default=str)
-        typer.echo(f"Data saved to {output}")
+    output = _dumps_json(data)
+    if args.output:
+        args.output.write_bytes(output)
+        print(f"Data saved to {args.output}")
     else:
-        typer.echo("\nFetched data:")
-        typer.echo(json.dumps(data, indent=2, default=str))
+        print("\nFetched data:")
+        sys.stdout.flush()
+        sys.stdout.buffer.write(output + b"\n")
 
 
-@app.command()
-def demo(
-    output: Optional[Path] = typer.Option(
-        None,
-        "--output", "-o",
-        help="Save demo frame to image file instead of sending to device",
-    ),
-    ip: Optional[str] = typer.Option(None, "--ip", help="IP address of Pixoo device"),
-    config_dir: Path = typer.Option(Path("config"), "--config-dir", "-c"),
-) -> None:
-    """Render a demo frame to test the display."""
+# Demo frame is deterministic; cache its RGB bytes per package version
+_DEMO_SIZE = 64
+_DEMO_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "divoom_client"
+    / f"demo-{__version__}-{_DEMO_SIZE}x{_DEMO_SIZE}.bin"
+)
+
+
+def _render_demo_frame() -> bytes:
+    """Draw the demo frame and return it as packed RGB bytes."""
     from divoom_client.core.fonts import get_font
+    from divoom_client.core.frame import Frame
 
     frame = Frame("#000033")
 
@@ -415,13 +544,7 @@ def demo(
 
     # Draw text
     font = get_font("5x7")
-    text = "DIVOOM"
-    x = 14
-    for char in text:
-        pixels = font.render_char(char, (255, 255, 255))
-        for px, py, color in pixels:
-            frame.set_pixel(x + px, 2 + py, color)
-        x += font.width + font.spacing
+    frame.draw_text(14, 2, "DIVOOM", font, (255, 255, 255))
 
     # Draw some colored rectangles
     frame.draw_rect(5, 20, 15, 15, (255, 0, 0), filled=True)   # Red
@@ -429,41 +552,58 @@ def demo(
     frame.draw_rect(45, 20, 15, 15, (0, 0, 255), filled=True)  # Blue
 
     # Draw stock-like text
-    x = 5
-    for char in "$123.45":
-        pixels = font.render_char(char, (0, 255, 100))
-        for px, py, color in pixels:
-            frame.set_pixel(x + px, 45 + py, color)
-        x += font.width + font.spacing
+    frame.draw_text(5, 45, "$123.45", font, (0, 255, 100))
 
-    # Output
-    if output:
-        frame.save(str(output))
-        typer.echo(f"Demo frame saved to {output}")
-    else:
-        if ip:
-            device = Pixoo(ip)
-        else:
-            device = get_device(config_dir)
+    return frame.to_bytes()
 
-        if device is None:
-            typer.echo("No device found. Use --output to save as image instead.", err=True)
-            raise typer.Exit(1)
 
-        device.send_pixels(frame.to_pixels())
-        typer.echo(f"Demo frame sent to device at {device.ip_address}")
+def _get_demo_frame() -> bytes:
+    """Load the demo frame from the disk cache, rendering it on a miss."""
+    expected = _DEMO_SIZE * _DEMO_SIZE * 3
+    try:
+        data = _DEMO_CACHE_PATH.read_bytes()
+        if len(data) == expected:
+            return data
+    except OSError:
+        pass
 
+    data = _render_demo_frame()
+    try:
+        _DEMO_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _DEMO_CACHE_PATH.write_bytes(data)
+    except OSError as e:
+        logging.getLogger(__name__).debug(f"Could not cache demo frame: {e}")
+    return data
 
-@app.command()
-def serve(
-    layout_file: Path = typer.Argument(..., help="Path to layout JSON file"),
-    ip: Optional[str] = typer.Option(None, "--ip", help="IP address of Pixoo device"),
-    config_dir: Path = typer.Option(Path("config"), "--config-dir", "-c"),
-    assets_dir: Path = typer.Option(Path("assets"), "--assets", "-a", help="Assets directory"),
-    web: bool = typer.Option(False, "--web", "-w", help="Start web UI"),
-    web_port: int = typer.Option(8080, "--port", "-p", help="Web UI port"),
-    no_device: bool = typer.Option(False, "--no-device", help="Run without connecting to device"),
-) -> None:
+
+def _cmd_demo(argv: list[str]) -> None:
+    """Render a demo frame to test the display."""
+    parser = _parser("demo", "Render a demo frame to test the display.")
+    parser.add_argument(
+        "--output", "-o",
+        type=Path,
+        default=None,
+        help="Save demo frame to image file instead of sending to device",
+    )
+    _add_ip_option(parser)
+    _add_config_dir_option(parser)
+    args = parser.parse_args(argv)
+
+    data = _get_demo_frame()
+
+    # Output
+    if args.output:
+        from PIL import Image
+
+        Image.frombytes("RGB", (_DEMO_SIZE, _DEMO_SIZE), data).save(str(args.output))
+        print(f"Demo frame saved to {args.output}")
+    else:
+        device = _connect_or_exit(args.ip, args.config_dir)
+        device.send_rgb_bytes(data)
+        print(f"Demo frame sent to device at {device.ip_address}")
+
+
+def _cmd_serve(argv: list[str]) -> None:
     """Start the display manager with scheduled updates.
 
     This runs continuously, fetching data and updating the display
@@ -473,33 +613,53 @@ def serve(
     import signal
     from divoom_client.core.display_manager import DisplayManager
 
-    manager = DisplayManager(config_dir=config_dir, assets_dir=assets_dir)
+    parser = _parser("serve", "Start the display manager with scheduled updates.")
+    parser.add_argument("layout_file", type=Path, help="Path to layout JSON file")
+    _add_ip_option(parser)
+    _add_config_dir_option(parser)
+    _add_assets_option(parser)
+    parser.add_argument("--web", "-w", action="store_true", help="Start web UI")
+    parser.add_argument(
+        "--port", "-p",
+        dest="web_port",
+        type=int,
+        default=8080,
+        help="Web UI port",
+    )
+    parser.add_argument(
+        "--no-device",
+        action="store_true",
+        help="Run without connecting to device",
+    )
+    args = parser.parse_args(argv)
+
+    manager = DisplayManager(config_dir=args.config_dir, assets_dir=args.assets_dir)
 
     # Load layout
-    if not manager.load_layout(layout_file):
-        typer.echo(f"Failed to load layout: {layout_file}", err=True)
-        raise typer.Exit(1)
+    if not manager.load_layout(args.layout_file):
+        _error(f"Failed to load layout: {args.layout_file}")
+        sys.exit(1)
 
     # Load data sources
     manager.load_datasources()
 
     # Connect to device (unless --no-device)
-    if not no_device:
-        if not manager.connect(ip):
-            typer.echo("Warning: No device connected. Display updates will be skipped.", err=True)
-            typer.echo("Use --no-device to suppress this warning.")
+    if not args.no_device:
+        if not manager.connect(args.ip):
+            _error("Warning: No device connected. Display updates will be skipped.")
+            print("Use --no-device to suppress this warning.")
 
-    typer.echo(f"Starting display manager with layout: {manager.layout.name}")
-    typer.echo(f"Data sources: {list(manager._data_manager.sources.keys())}")
-    typer.echo("Press Ctrl+C to stop\n")
+    print(f"Starting display manager with layout: {manager.layout.name}")
+    print(f"Data sources: {list(manager._data_manager.sources.keys())}")
+    print("Press Ctrl+C to stop\n")
 
     async def run() -> None:
         # Handle signals for graceful shutdown
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         stop_event = asyncio.Event()
 
         def handle_signal() -> None:
-            typer.echo("\nShutting down...")
+            print("\nShutting down...")
             stop_event.set()
 
         for sig in (signal.SIGINT, signal.SIGTERM):
@@ -510,15 +670,15 @@ def serve(
 
         # Show status
         status = manager.get_status()
-        typer.echo("Status:")
-        typer.echo(f"  Device: {status['device_ip'] or 'not connected'}")
-        typer.echo(f"  Layout: {status['layout_name']}")
-        typer.echo(f"  Data sources: {', '.join(status['data_sources']) or 'none'}")
-        typer.echo(f"  Scheduled jobs: {len(status['scheduled_jobs'])}")
-        typer.echo("")
+        print("Status:")
+        print(f"  Device: {status['device_ip'] or 'not connected'}")
+        print(f"  Layout: {status['layout_name']}")
+        print(f"  Data sources: {', '.join(status['data_sources']) or 'none'}")
+        print(f"  Scheduled jobs: {len(status['scheduled_jobs'])}")
+        print("")
 
         # If web UI requested, start it
-        if web:
+        if args.web:
             import uvicorn
             from divoom_client.web.app import create_app
 
@@ -526,13 +686,13 @@ def serve(
             config = uvicorn.Config(
                 web_app,
                 host="0.0.0.0",
-                port=web_port,
+                port=args.web_port,
                 log_level="info",
             )
             server = uvicorn.Server(config)
 
-            typer.echo(f"Web UI available at http://localhost:{web_port}")
-            typer.echo("")
+            print(f"Web UI available at http://localhost:{args.web_port}")
+            print("")
 
             # Run server until stop signal
             server_task = asyncio.create_task(server.serve())
@@ -550,52 +710,102 @@ def serve(
     except KeyboardInterrupt:
         pass
 
-    typer.echo("Display manager stopped.")
+    print("Display manager stopped.")
 
 
-@app.command()
-def status(
-    config_dir: Path = typer.Option(Path("config"), "--config-dir", "-c"),
-) -> None:
+def _cmd_status(argv: list[str]) -> None:
     """Show status of data sources and configuration."""
-    from divoom_client.datasources.manager import DataSourceManager
+    parser = _parser("status", "Show status of data sources and configuration.")
+    _add_config_dir_option(parser)
+    args = parser.parse_args(argv)
+    config_dir: Path = args.config_dir
 
     # Check device config
     device_config = config_dir / "device.json"
     if device_config.exists():
-        with open(device_config) as f:
-            device = json.load(f)
-        typer.echo("Device configuration:")
-        typer.echo(f"  IP: {device.get('ip_address') or 'auto-discover'}")
-        typer.echo(f"  Brightness: {device.get('brightness', 100)}%")
+        device = _load_json(device_config)
+        print("Device configuration:")
+        print(f"  IP: {device.get('ip_address') or 'auto-discover'}")
+        print(f"  Brightness: {device.get('brightness', 100)}%")
     else:
-        typer.echo("Device configuration: not found")
+        print("Device configuration: not found")
 
-    typer.echo("")
+    print("")
 
     # Check data sources
     datasources_config = config_dir / "datasources.json"
     if datasources_config.exists():
-        manager = DataSourceManager()
-        manager.load_config(datasources_config)
-        typer.echo(f"Data sources ({len(manager.sources)}):")
+        manager = _get_manager(config_dir)
+        print(f"Data sources ({len(manager.sources)}):")
         for name, source in manager.sources.items():
-            typer.echo(f"  {name}: {source.source_type} (every {source.config.refresh_seconds}s)")
+            print(f"  {name}: {source.source_type} (every {source.config.refresh_seconds}s)")
     else:
-        typer.echo("Data sources: not configured")
+        print("Data sources: not configured")
 
-    typer.echo("")
+    print("")
 
     # Check layouts
     layouts_dir = config_dir / "layouts"
     if layouts_dir.exists():
         layouts = list(layouts_dir.glob("*.json"))
-        typer.echo(f"Layouts ({len(layouts)}):")
+        print(f"Layouts ({len(layouts)}):")
         for layout_path in layouts:
-            typer.echo(f"  {layout_path.name}")
+            print(f"  {layout_path.name}")
     else:
-        typer.echo("Layouts: none found")
+        print("Layouts: none found")
+
+
+# Subcommand dispatch table; each handler parses its own arguments
+_COMMANDS: dict[str, Callable[[list[str]], None]] = {
+    "version": _cmd_version,
+    "discover": _cmd_discover,
+    "test": _cmd_test,
+    "brightness": _cmd_brightness,
+    "clear": _cmd_clear,
+    "on": _cmd_on,
+    "off": _cmd_off,
+    "render": _cmd_render,
+    "live": _cmd_live,
+    "fetch": _cmd_fetch,
+    "demo": _cmd_demo,
+    "serve": _cmd_serve,
+    "status": _cmd_status,
+}
+
+# Commands that never log, so skip configuring the logging machinery
+_QUIET_COMMANDS = frozenset({"version"})
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Divoom Pixoo 64 display manager."""
+    args = sys.argv[1:] if argv is None else list(argv)
+
+    verbose = False
+    while args and args[0].startswith("-"):
+        option = args.pop(0)
+        if option in ("-v", "--verbose"):
+            verbose = True
+        elif option in ("-h", "--help"):
+            print(_HELP, end="")
+            return
+        else:
+            _error(f"Error: No such option: {option}")
+            sys.exit(2)
+
+    if not args:
+        print(_HELP, end="")
+        return
+
+    name, command_args = args[0], args[1:]
+    command = _COMMANDS.get(name)
+    if command is None:
+        _error(f"Error: No such command '{name}'.")
+        sys.exit(2)
+
+    if name not in _QUIET_COMMANDS:
+        setup_logging(verbose)
+    command(command_args)
 
 
 if __name__ == "__main__":
-    app()
+    main()
@@ -1,12 +1,35 @@
-"""Core functionality for divoom_client."""
+"""Core functionality for divoom_client.
 
-from divoom_client.core.pixoo import Pixoo
-from divoom_client.core.discovery import discover_device, get_device
-from divoom_client.core.frame import Frame, parse_color
-from divoom_client.core.fonts import BitmapFont, get_font
-from divoom_client.core.renderer import Renderer
-from divoom_client.core.scheduler import Scheduler
-from divoom_client.core.display_manager import DisplayManager
+Submodules are imported on first attribute access (PEP 562) so that importing
+one lightweight module (e.g. discovery) does not pull in PIL, pydantic and
+APScheduler through the renderer, scheduler and display manager.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from divoom_client.core.discovery import discover_device, get_device
+    from divoom_client.core.display_manager import DisplayManager
+    from divoom_client.core.fonts import BitmapFont, get_font
+    from divoom_client.core.frame import Frame, parse_color
+    from divoom_client.core.pixoo import Pixoo
+    from divoom_client.core.renderer import Renderer
+    from divoom_client.core.scheduler import Scheduler
+
+# Exported name -> defining submodule
+_EXPORTS = {
+    "Pixoo": "divoom_client.core.pixoo",
+    "discover_device": "divoom_client.core.discovery",
+    "get_device": "divoom_client.core.discovery",
+    "Frame": "divoom_client.core.frame",
+    "parse_color": "divoom_client.core.frame",
+    "BitmapFont": "divoom_client.core.fonts",
+    "get_font": "divoom_client.core.fonts",
+    "Renderer": "divoom_client.core.renderer",
+    "Scheduler": "divoom_client.core.scheduler",
+    "DisplayManager": "divoom_client.core.display_manager",
+}
 
 __all__ = [
     "Pixoo",
@@ -20,3 +43,12 @@ __all__ = [
     "Scheduler",
     "DisplayManager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
@@ -1,13 +1,15 @@
 """Device discovery for Pixoo devices."""
 
-import concurrent.futures
+import asyncio
+import errno
+import functools
 import json
 import logging
+import selectors
 import socket
+import time
 from pathlib import Path
-from typing import Optional
-
-import requests
+from typing import Any, Optional, cast
 
 from divoom_client.core.pixoo import Pixoo
 from divoom_client.models.config import DeviceConfig
@@ -17,32 +19,106 @@ logger = logging.getLogger(__name__)
 PIXOO_DISCOVERY_PORT = 8888
 DISCOVERY_TIMEOUT = 3.0
 DISCOVERY_MESSAGE = b"divoom"
+# When only the first device is wanted, stop listening this long after it answers
+DISCOVERY_GRACE = 0.3
 HTTP_SCAN_TIMEOUT = 0.5
-HTTP_SCAN_WORKERS = 50
+TCP_SCAN_TIMEOUT = 0.3
+# Connects in flight at once during the subnet sweep (bounded by the fd limit)
+TCP_SCAN_BATCH = 64
+SSDP_ADDRESS = "239.255.255.250"
+SSDP_PORT = 1900
+SSDP_TIMEOUT = 1.2
+SSDP_SEARCH_TARGET = "urn:divoom:device:pixoo:1"
+SSDP_MESSAGE = (
+    "M-SEARCH * HTTP/1.1\r\n"
+    f"HOST: {SSDP_ADDRESS}:{SSDP_PORT}\r\n"
+    'MAN: "ssdp:discover"\r\n'
+    "MX: 1\r\n"
+    f"ST: {SSDP_SEARCH_TARGET}\r\n"
+    "\r\n"
+).encode()
+
+# Probe payload is identical for every host; encode it once
+_PROBE_BODY = json.dumps({"Command": "Channel/GetIndex"}).encode()
+
+# HEAD /post statuses that rule a host out without sending the POST probe
+# (redirects and auth walls from routers, NAS boxes, printers, ...)
+_NON_PIXOO_STATUSES = frozenset({b"301", b"302", b"303", b"307", b"308", b"401", b"403"})
+
+
+@functools.lru_cache(maxsize=8)
+def _load_device_config_raw_cached(path_str: str, mtime_ns: int) -> Optional[dict[str, Any]]:
+    """Parse device.json without validation, cached per (path, mtime)."""
+    try:
+        with open(path_str) as f:
+            data = json.load(f)
+    except json.JSONDecodeError as e:
+        logger.warning(f"Invalid device config at {path_str}: {e}")
+        return None
+
+    if not isinstance(data, dict):
+        logger.warning(f"Invalid device config at {path_str}: expected a JSON object")
+        return None
+    return data
+
+
+@functools.lru_cache(maxsize=8)
+def _load_device_config_cached(path_str: str, mtime_ns: int) -> Optional[DeviceConfig]:
+    """Validate device.json as a DeviceConfig, cached per (path, mtime)."""
+    data = _load_device_config_raw_cached(path_str, mtime_ns)
+    if data is None:
+        return None
+    try:
+        config = DeviceConfig.model_validate(data)
+        logger.debug(f"Loaded device config: {config}")
+        return config
+    except ValueError as e:
+        logger.warning(f"Invalid device config at {path_str}: {e}")
+        return None
+
+
+def _config_mtime_ns(config_path: Path) -> Optional[int]:
+    """Get the mtime of a config file, or None if it does not exist."""
+    try:
+        return config_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        logger.debug(f"No config file at {config_path}")
+        return None
+
+
+def load_device_config_raw(config_path: Path) -> Optional[dict[str, Any]]:
+    """Load device configuration as a plain dict, skipping model validation.
+
+    Discovery only needs ``ip_address`` and ``device_id``, so it reads the
+    parsed JSON directly. The returned dict is cached and must not be mutated.
+
+    Args:
+        config_path: Path to device.json
+
+    Returns:
+        Parsed config dict if file exists and is a JSON object, None otherwise
+    """
+    mtime_ns = _config_mtime_ns(config_path)
+    if mtime_ns is None:
+        return None
+    return _load_device_config_raw_cached(str(config_path), mtime_ns)
 
 
 def load_device_config(config_path: Path) -> Optional[DeviceConfig]:
     """Load device configuration from file.
 
+    Parsed configs are cached until the file's mtime changes.
+
     Args:
         config_path: Path to device.json
 
     Returns:
         DeviceConfig if file exists and is valid, None otherwise
     """
-    if not config_path.exists():
-        logger.debug(f"No config file at {config_path}")
-        return None
-
-    try:
-        with open(config_path) as f:
-            data = json.load(f)
-        config = DeviceConfig.model_validate(data)
-        logger.debug(f"Loaded device config: {config}")
-        return config
-    except (json.JSONDecodeError, ValueError) as e:
-        logger.warning(f"Invalid device config at {config_path}: {e}")
+    mtime_ns = _config_mtime_ns(config_path)
+    if mtime_ns is None:
         return None
+    return _load_device_config_cached(str(config_path), mtime_ns)
 
 
 def save_device_config(config: DeviceConfig, config_path: Path) -> None:
@@ -58,25 +134,235 @@ def save_device_config(config: DeviceConfig, config_path: Path) -> None:
     logger.info(f"Saved device config to {config_path}")
 
 
-def _check_pixoo_http(ip: str) -> Optional[str]:
+def _build_head_request(ip: str) -> bytes:
+    """Build the raw HEAD request used to pre-filter probe candidates.
+
+    Args:
+        ip: IP address being probed
+
+    Returns:
+        Encoded HTTP/1.1 HEAD request for /post (keep-alive)
+    """
+    return f"HEAD /post HTTP/1.1\r\nHost: {ip}\r\n\r\n".encode()
+
+
+def _build_probe_request(ip: str) -> bytes:
+    """Build the raw HTTP request used to probe for a Pixoo.
+
+    Args:
+        ip: IP address being probed
+
+    Returns:
+        Encoded HTTP POST request for Channel/GetIndex
+    """
+    head = (
+        f"POST /post HTTP/1.1\r\n"
+        f"Host: {ip}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(_PROBE_BODY)}\r\n"
+        f"Connection: close\r\n\r\n"
+    )
+    return head.encode() + _PROBE_BODY
+
+
+def _await_connects(
+    selector: selectors.BaseSelector,
+    connected: dict[str, socket.socket],
+    timeout: float,
+) -> None:
+    """Wait for the connects registered on a selector to finish.
+
+    Sockets that connect are added to connected; failed ones and any still
+    pending at the deadline are closed. The selector is left empty.
+
+    Args:
+        selector: Selector with in-progress sockets registered for writing
+        connected: Mapping of IP address to connected socket, updated in place
+        timeout: Connect deadline in seconds
+    """
+    deadline = time.monotonic() + timeout
+    while selector.get_map():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        for key, _ in selector.select(remaining):
+            sock = cast(socket.socket, key.fileobj)
+            selector.unregister(sock)
+            if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                connected[key.data] = sock
+            else:
+                sock.close()
+
+    # Anything still pending missed the deadline
+    for key in list(selector.get_map().values()):
+        sock = cast(socket.socket, key.fileobj)
+        selector.unregister(sock)
+        sock.close()
+
+
+def _tcp_sweep(
+    hosts: list[str],
+    port: int = 80,
+    timeout: float = TCP_SCAN_TIMEOUT,
+) -> dict[str, socket.socket]:
+    """Find hosts accepting TCP connections with non-blocking connect sweeps.
+
+    Up to TCP_SCAN_BATCH connects are in flight at once and a single
+    selector polls them, so a whole /24 costs a few poll loops instead of
+    a task per host. If the process runs out of file descriptors, the
+    in-flight connects are drained and the sweep resumes where it stopped.
+
+    Args:
+        hosts: IP addresses to connect to
+        port: TCP port to connect to
+        timeout: Connect deadline per batch in seconds
+
+    Returns:
+        Mapping of IP address to its connected, non-blocking socket
+    """
+    connected: dict[str, socket.socket] = {}
+    index = 0
+
+    with selectors.DefaultSelector() as selector:
+        while index < len(hosts):
+            while index < len(hosts) and len(selector.get_map()) < TCP_SCAN_BATCH:
+                ip = hosts[index]
+                try:
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                except OSError as e:
+                    if selector.get_map():
+                        # Free up descriptors, then retry this host
+                        logger.debug(f"Could not open socket for {ip}: {e}")
+                        break
+                    skipped = hosts[index:]
+                    logger.warning(
+                        f"Could not open socket for {ip}: {e}; "
+                        f"skipping {len(skipped)} host(s) {skipped[0]}-{skipped[-1]}"
+                    )
+                    return connected
+                index += 1
+                sock.setblocking(False)
+                err = sock.connect_ex((ip, port))
+                if err == 0:
+                    connected[ip] = sock
+                elif err in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    selector.register(sock, selectors.EVENT_WRITE, ip)
+                else:
+                    sock.close()
+
+            _await_connects(selector, connected, timeout)
+
+    return connected
+
+
+async def _exchange_probe(
+    ip: str,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> bytes:
+    """Send the probe request over an open connection and read the response.
+
+    Args:
+        ip: IP address being probed
+        reader: Stream reader for the connection
+        writer: Stream writer for the connection
+
+    Returns:
+        Raw response bytes (read until the marker field or EOF)
+    """
+    writer.write(_build_probe_request(ip))
+    await writer.drain()
+    response = b""
+    while b"error_code" not in response:
+        chunk = await reader.read(1024)
+        if not chunk:
+            break
+        response += chunk
+    return response
+
+
+async def _exchange_head(
+    ip: str,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> bytes:
+    """Send the HEAD pre-filter over an open connection and read its headers.
+
+    Args:
+        ip: IP address being probed
+        reader: Stream reader for the connection
+        writer: Stream writer for the connection
+
+    Returns:
+        Raw response header bytes (empty if the server closed the connection)
+    """
+    writer.write(_build_head_request(ip))
+    await writer.drain()
+    response = b""
+    while b"\r\n\r\n" not in response:
+        chunk = await reader.read(1024)
+        if not chunk:
+            break
+        response += chunk
+    return response
+
+
+async def _check_pixoo_http(ip: str, sock: socket.socket) -> Optional[str]:
     """Check if an IP has a Pixoo device via HTTP API.
 
+    A HEAD of /post first weeds out web servers that redirect or demand
+    auth; only the survivors get the definitive POST probe. Reuses the
+    connection opened by the TCP sweep instead of handshaking a second
+    time, unless the server closes it after the HEAD.
+
     Args:
         ip: IP address to check
+        sock: Connected socket from the sweep
 
     Returns:
         IP address if Pixoo found, None otherwise
     """
     try:
-        r = requests.post(
-            f"http://{ip}:80/post",
-            json={"Command": "Channel/GetIndex"},
-            timeout=HTTP_SCAN_TIMEOUT,
+        reader, writer = await asyncio.open_connection(sock=sock)
+    except OSError:
+        sock.close()
+        return None
+
+    try:
+        try:
+            head = await asyncio.wait_for(
+                _exchange_head(ip, reader, writer), timeout=HTTP_SCAN_TIMEOUT
+            )
+        except (OSError, asyncio.TimeoutError):
+            # No answer to HEAD (or a reset from a server that rejects unknown
+            # methods) is not proof of a non-Pixoo; let POST decide on a new
+            # connection
+            head = b""
+
+        status_line = head.partition(b"\r\n")[0]
+        status = status_line.split(b" ")[1:2]
+        if status and status[0] in _NON_PIXOO_STATUSES:
+            logger.debug(f"Skipping {ip}: {status_line.decode(errors='replace')}")
+            return None
+
+        if not status_line.startswith(b"HTTP/1.1") or b"connection: close" in head.lower():
+            writer.close()
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(ip, 80), timeout=TCP_SCAN_TIMEOUT
+            )
+
+        response = await asyncio.wait_for(
+            _exchange_probe(ip, reader, writer), timeout=HTTP_SCAN_TIMEOUT
         )
-        if r.status_code == 200 and "error_code" in r.json():
-            return ip
-    except Exception:
-        pass
+    except (OSError, asyncio.TimeoutError):
+        return None
+    finally:
+        writer.close()
+
+    # Existence check only: skip decoding the JSON body
+    status_line, _, rest = response.partition(b"\r\n")
+    if status_line.split(b" ")[1:2] == [b"200"] and b"error_code" in rest:
+        return ip
     return None
 
 
@@ -96,6 +382,43 @@ def _get_local_subnet() -> Optional[str]:
         return None
 
 
+def _local_subnets() -> list[str]:
+    """Get the /24 prefixes of this host's non-loopback IPv4 interfaces.
+
+    Returns:
+        List of subnet prefixes (e.g. '192.168.1'), default route first
+    """
+    subnets: list[str] = []
+
+    default_subnet = _get_local_subnet()
+    if default_subnet:
+        subnets.append(default_subnet)
+
+    try:
+        infos = socket.getaddrinfo(socket.gethostname(), None, socket.AF_INET)
+    except OSError:
+        infos = []
+    for info in infos:
+        ip = str(info[4][0])
+        subnet = ".".join(ip.split(".")[:3])
+        if not ip.startswith("127.") and subnet not in subnets:
+            subnets.append(subnet)
+
+    return subnets
+
+
+def _broadcast_addresses() -> list[str]:
+    """Get the broadcast destinations for UDP discovery.
+
+    The limited broadcast only leaves through the default interface, so
+    each local interface's /24 directed broadcast is targeted as well.
+
+    Returns:
+        List of broadcast addresses
+    """
+    return ["<broadcast>"] + [f"{subnet}.255" for subnet in _local_subnets()]
+
+
 def scan_network_http() -> list[str]:
     """Scan the local subnet for Pixoo devices using HTTP.
 
@@ -110,107 +433,259 @@ def scan_network_http() -> list[str]:
         return []
 
     logger.info(f"Scanning {subnet}.1-254 for Pixoo devices...")
-    discovered = []
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=HTTP_SCAN_WORKERS) as executor:
-        futures = {
-            executor.submit(_check_pixoo_http, f"{subnet}.{i}"): i
-            for i in range(1, 255)
-        }
-        for future in concurrent.futures.as_completed(futures):
-            result = future.result()
-            if result:
-                logger.info(f"Discovered Pixoo device at {result}")
-                discovered.append(result)
+    discovered = asyncio.run(_scan_subnet_http(subnet))
+    for ip in discovered:
+        logger.info(f"Discovered Pixoo device at {ip}")
 
     return discovered
 
 
-def scan_network_udp() -> list[str]:
-    """Scan the network for Pixoo devices using UDP broadcast.
+async def _scan_subnet_http(subnet: str) -> list[str]:
+    """Probe every host in a /24 concurrently from a single event loop.
+
+    A single non-blocking connect sweep to port 80 filters the subnet first;
+    only hosts with the port open receive the full HTTP probe.
+
+    Args:
+        subnet: Subnet prefix (e.g., '192.168.1')
 
     Returns:
-        List of discovered IP addresses
+        List of IP addresses that answered like a Pixoo
     """
-    discovered = []
+    hosts = [f"{subnet}.{i}" for i in range(1, 255)]
 
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-        sock.settimeout(DISCOVERY_TIMEOUT)
+    connected = await asyncio.to_thread(_tcp_sweep, hosts)
+    logger.debug(f"{len(connected)} host(s) with port 80 open: {list(connected)}")
+
+    results = await asyncio.gather(
+        *(_check_pixoo_http(ip, sock) for ip, sock in connected.items())
+    )
+    return [ip for ip in results if ip]
+
+
+class _DatagramCollector(asyncio.DatagramProtocol):
+    """Datagram protocol that records the source IP of each reply."""
+
+    def __init__(self, marker: Optional[bytes] = None):
+        self.marker = marker
+        self.discovered: list[str] = []
+        self.first_reply = asyncio.Event()
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        ip_address = addr[0]
+        # Ignore unrelated responders that answer any search
+        if self.marker is not None and self.marker not in data.lower():
+            return
+        if ip_address not in self.discovered:
+            self.discovered.append(ip_address)
+            self.first_reply.set()
+
+    def error_received(self, exc: Exception) -> None:
+        # Send failures (e.g. an unreachable directed broadcast) land here
+        logger.debug(f"Discovery datagram error: {exc}")
+
+
+async def _collect_datagrams(
+    message: bytes,
+    addresses: list[tuple[str, int]],
+    timeout: float,
+    marker: Optional[bytes] = None,
+    ttl: Optional[int] = None,
+    first_only: bool = False,
+) -> list[str]:
+    """Send a datagram to each address and collect reply addresses.
+
+    The socket is non-blocking and read by the event loop's selector, so
+    every reply arriving before the deadline is kept, not just those that
+    beat a single blocking recv. Listening stops at the timeout, or with
+    first_only, DISCOVERY_GRACE after the first reply if that is sooner.
 
-        sock.sendto(DISCOVERY_MESSAGE, ("<broadcast>", PIXOO_DISCOVERY_PORT))
-        logger.debug(f"Sent discovery broadcast on port {PIXOO_DISCOVERY_PORT}")
+    Args:
+        message: Payload to send
+        addresses: Destinations (host, port) to send to
+        timeout: How long to listen for replies, in seconds
+        marker: If given, only replies containing this (lowercase) bytestring count
+        ttl: Multicast TTL to set on the socket
+        first_only: Stop early once a reply arrives instead of listening
+            for the full timeout
+
+    Returns:
+        List of replying IP addresses, in arrival order
+    """
+    loop = asyncio.get_running_loop()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+    if ttl is not None:
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, ttl)
+    sock.setblocking(False)
+
+    transport, protocol = await loop.create_datagram_endpoint(
+        lambda: _DatagramCollector(marker), sock=sock
+    )
+    try:
+        for address in addresses:
+            transport.sendto(message, address)
 
-        while True:
+        if first_only:
+            deadline = loop.time() + timeout
             try:
-                data, addr = sock.recvfrom(1024)
-                ip_address = addr[0]
-                logger.info(f"Discovered Pixoo device at {ip_address}")
-                discovered.append(ip_address)
-            except socket.timeout:
-                break
+                await asyncio.wait_for(protocol.first_reply.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                await asyncio.sleep(max(0.0, min(DISCOVERY_GRACE, deadline - loop.time())))
+        else:
+            await asyncio.sleep(timeout)
+    finally:
+        transport.close()
+
+    return protocol.discovered
 
+
+async def _scan_udp(first_only: bool = False) -> list[str]:
+    """Broadcast the Divoom discovery message and collect replies.
+
+    Args:
+        first_only: Stop listening shortly after the first reply
+    """
+    try:
+        targets = _broadcast_addresses()
+        logger.debug(f"Sending discovery broadcast on port {PIXOO_DISCOVERY_PORT} to {targets}")
+        discovered = await _collect_datagrams(
+            DISCOVERY_MESSAGE,
+            [(target, PIXOO_DISCOVERY_PORT) for target in targets],
+            DISCOVERY_TIMEOUT,
+            first_only=first_only,
+        )
     except OSError as e:
         logger.warning(f"UDP broadcast failed: {e}")
-    finally:
-        sock.close()
+        return []
 
+    for ip_address in discovered:
+        logger.info(f"Discovered Pixoo device at {ip_address}")
     return discovered
 
 
-def scan_network() -> list[str]:
-    """Scan the network for Pixoo devices.
+async def _scan_ssdp(first_only: bool = False) -> list[str]:
+    """Send an SSDP M-SEARCH and collect replies from Divoom devices.
 
-    Tries UDP broadcast first (fast), then falls back to HTTP scan (reliable).
+    Args:
+        first_only: Stop listening shortly after the first reply
+    """
+    try:
+        logger.debug(f"Sending SSDP M-SEARCH to {SSDP_ADDRESS}:{SSDP_PORT}")
+        discovered = await _collect_datagrams(
+            SSDP_MESSAGE,
+            [(SSDP_ADDRESS, SSDP_PORT)],
+            SSDP_TIMEOUT,
+            marker=b"divoom",
+            ttl=2,
+            first_only=first_only,
+        )
+    except OSError as e:
+        logger.warning(f"SSDP discovery failed: {e}")
+        return []
+
+    for ip_address in discovered:
+        logger.info(f"Discovered Pixoo device at {ip_address} (SSDP)")
+    return discovered
+
+
+def scan_network_udp() -> list[str]:
+    """Scan the network for Pixoo devices using UDP broadcast.
 
     Returns:
         List of discovered IP addresses
     """
-    # Try fast UDP broadcast first
-    logger.debug("Trying UDP broadcast discovery...")
-    discovered = scan_network_udp()
+    return asyncio.run(_scan_udp())
+
+
+def scan_network_ssdp() -> list[str]:
+    """Scan the network for Pixoo devices using an SSDP multicast M-SEARCH.
+
+    Returns:
+        List of discovered IP addresses
+    """
+    return asyncio.run(_scan_ssdp())
 
-    if discovered:
-        return discovered
+
+async def _scan_network(first_only: bool = False) -> list[str]:
+    """Run SSDP and UDP discovery concurrently, then fall back to HTTP.
+
+    Args:
+        first_only: Stop listening shortly after the first reply
+    """
+    logger.debug("Trying SSDP and UDP broadcast discovery...")
+    pending = {
+        asyncio.create_task(_scan_ssdp(first_only)),
+        asyncio.create_task(_scan_udp(first_only)),
+    }
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                discovered = task.result()
+                if discovered:
+                    return discovered
+    finally:
+        # Don't wait for the slower scan once we have an answer
+        for task in pending:
+            task.cancel()
 
     # Fall back to HTTP scan
-    logger.debug("UDP broadcast found nothing, trying HTTP scan...")
-    return scan_network_http()
+    logger.debug("SSDP and UDP broadcast found nothing, trying HTTP scan...")
+    subnet = _get_local_subnet()
+    if not subnet:
+        logger.warning("Could not determine local subnet")
+        return []
 
+    logger.info(f"Scanning {subnet}.1-254 for Pixoo devices...")
+    discovered = await _scan_subnet_http(subnet)
+    for ip in discovered:
+        logger.info(f"Discovered Pixoo device at {ip}")
+    return discovered
 
-def discover_device(config_dir: Optional[Path] = None) -> Optional[str]:
-    """Discover a Pixoo device.
 
-    Priority:
-    1. Check config file for manual IP
-    2. Scan network for devices
+def scan_network(first_only: bool = False) -> list[str]:
+    """Scan the network for Pixoo devices.
+
+    Runs SSDP multicast and UDP broadcast discovery concurrently on one event
+    loop and returns as soon as either finds a device, then falls back to
+    HTTP scan (reliable).
 
     Args:
-        config_dir: Path to config directory (default: ./config)
+        first_only: Only the first device is needed, so stop listening
+            DISCOVERY_GRACE after it answers instead of the full timeout
 
     Returns:
-        IP address of discovered device, or None
+        List of discovered IP addresses
     """
-    config_dir = config_dir or Path("config")
-    config_path = config_dir / "device.json"
+    return asyncio.run(_scan_network(first_only))
 
-    config = load_device_config(config_path)
-    if config and config.ip_address:
-        logger.info(f"Using configured IP address: {config.ip_address}")
-        return config.ip_address
 
-    logger.info("No configured IP, scanning network...")
-    discovered = scan_network()
+def _scan_and_save(config_path: Path) -> Optional[str]:
+    """Scan the network and persist the first device found.
+
+    Brightness and device_id from an existing, valid device.json are kept;
+    an invalid file is replaced with defaults.
+
+    Args:
+        config_path: Path to device.json
+
+    Returns:
+        IP address of discovered device, or None
+    """
+    discovered = scan_network(first_only=True)
 
     if discovered:
         ip_address = discovered[0]
         logger.info(f"Using discovered device at {ip_address}")
 
-        new_config = DeviceConfig(
-            ip_address=ip_address,
-            brightness=config.brightness if config else 100,
-        )
+        existing = load_device_config(config_path)
+        if existing is not None:
+            new_config = existing.model_copy(update={"ip_address": ip_address})
+        else:
+            new_config = DeviceConfig(ip_address=ip_address)
         save_device_config(new_config, config_path)
 
         return ip_address
@@ -219,26 +694,77 @@ def discover_device(config_dir: Optional[Path] = None) -> Optional[str]:
     return None
 
 
+def _read_device_config(config_dir: Optional[Path]) -> tuple[Path, Optional[dict[str, Any]]]:
+    """Resolve device.json under config_dir and read it once.
+
+    Args:
+        config_dir: Path to config directory (default: ./config)
+
+    Returns:
+        Tuple of (config path, raw config dict or None)
+    """
+    config_path = (config_dir or Path("config")) / "device.json"
+    return config_path, load_device_config_raw(config_path)
+
+
+def discover_device(config_dir: Optional[Path] = None) -> Optional[str]:
+    """Discover a Pixoo device.
+
+    Priority:
+    1. Check config file for manual IP
+    2. Scan network for devices
+
+    Args:
+        config_dir: Path to config directory (default: ./config)
+
+    Returns:
+        IP address of discovered device, or None
+    """
+    config_path, config = _read_device_config(config_dir)
+    ip_address: Optional[str] = config.get("ip_address") if config else None
+    if ip_address:
+        logger.info(f"Using configured IP address: {ip_address}")
+        return ip_address
+
+    logger.info("No configured IP, scanning network...")
+    return _scan_and_save(config_path)
+
+
 def get_device(config_dir: Optional[Path] = None) -> Optional[Pixoo]:
     """Get a connected Pixoo device.
 
+    A configured IP that answers a ping is used directly; the network is
+    only scanned when there is no configured IP or it stops responding.
+    A device found in place of a configured IP is used for this session
+    only, so device.json keeps the user's setting.
+
     Args:
         config_dir: Path to config directory
 
     Returns:
         Connected Pixoo instance, or None if no device found
     """
-    ip_address = discover_device(config_dir)
+    config_path, config = _read_device_config(config_dir)
+    configured_ip = config.get("ip_address") if config else None
+    device_id = (config.get("device_id") if config else None) or 0
+
+    if configured_ip:
+        device = Pixoo(ip_address=configured_ip, device_id=device_id)
+        if device.ping():
+            logger.info(f"Connected to Pixoo at {configured_ip}")
+            return device
+        device.close()
+        logger.warning(f"Configured device at {configured_ip} not responding, scanning network...")
+        discovered = scan_network(first_only=True)
+        ip_address = discovered[0] if discovered else None
+    else:
+        logger.info("No configured IP, scanning network...")
+        ip_address = _scan_and_save(config_path)
+
     if not ip_address:
         return None
 
-    config_path = (config_dir or Path("config")) / "device.json"
-    config = load_device_config(config_path)
-
-    device = Pixoo(
-        ip_address=ip_address,
-        device_id=config.device_id if config and config.device_id else 0,
-    )
+    device = Pixoo(ip_address=ip_address, device_id=device_id)
 
     if device.ping():
         logger.info(f"Connected to Pixoo at {ip_address}")
@@ -1,8 +1,11 @@
 """Display manager for coordinating updates to the Pixoo display."""
 
 import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import json
 import logging
+import threading
 from pathlib import Path
 from typing import Any, Optional
 
@@ -16,6 +19,22 @@ from divoom_client.models.layout import Layout
 
 logger = logging.getLogger(__name__)
 
+# Seconds between device liveness checks while running
+DEVICE_CHECK_INTERVAL = 30.0
+
+# Failed reconnects double the wait before the next check, up to this
+DEVICE_RECONNECT_MAX_INTERVAL = 600.0
+
+# Data updates landing within this window are rendered once
+RENDER_DEBOUNCE_MS = 50
+
+
+@functools.lru_cache(maxsize=16)
+def _load_layout_cached(path_str: str, mtime_ns: int, size: int) -> Layout:
+    """Parse and validate a layout file, cached per (path, mtime, size)."""
+    with open(path_str) as f:
+        return Layout.model_validate(json.load(f))
+
 
 class DisplayManager:
     """Manages the complete display pipeline: data -> render -> display."""
@@ -24,19 +43,36 @@ class DisplayManager:
         self,
         config_dir: Path = Path("config"),
         assets_dir: Path = Path("assets"),
+        render_debounce_ms: int = RENDER_DEBOUNCE_MS,
     ):
         """Initialize the display manager.
 
         Args:
             config_dir: Path to configuration directory
             assets_dir: Path to assets directory
+            render_debounce_ms: Window for coalescing data updates into one
+                render (0 renders on every update)
         """
         self.config_dir = config_dir
         self.assets_dir = assets_dir
 
         self._device: Optional[Pixoo] = None
+        self._connect_ip: Optional[str] = None
+        self._reconnect_enabled = False
+        self._device_ok = False
+        self._watchdog_task: Optional[asyncio.Task[None]] = None
+        self._send_lock = threading.Lock()
+        # Renders reuse one frame buffer; guard it across threads
+        self._render_lock = threading.Lock()
+        # One worker keeps scheduled frames in order off the event loop
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="display")
+        self._render_running = False
+        self._render_requested = False
+        self._render_debounce = render_debounce_ms / 1000
+        self._render_pending: Optional[asyncio.TimerHandle] = None
+        self._render_task: Optional[asyncio.Task[None]] = None
         self._layout: Optional[Layout] = None
-        self._data_manager = DataSourceManager()
+        self._data_manager = DataSourceManager(cache_path=config_dir / ".datasource_cache.json")
         self._renderer = Renderer(assets_dir=assets_dir)
         self._scheduler = Scheduler()
         self._current_frame: Optional[Frame] = None
@@ -75,6 +111,11 @@ class DisplayManager:
         Returns:
             True if connected successfully
         """
+        # Remember how we connected so the watchdog can reconnect the same way
+        self._connect_ip = ip
+        self._reconnect_enabled = True
+        self._close_device()
+
         if ip:
             self._device = Pixoo(ip)
             if self._device.ping():
@@ -93,9 +134,19 @@ class DisplayManager:
                 logger.warning("No Pixoo device found")
                 return False
 
+    def _close_device(self) -> None:
+        """Close the current device's keep-alive session and forget it."""
+        # Don't pull the session out from under a send in progress
+        with self._send_lock:
+            device, self._device = self._device, None
+        if device is not None:
+            device.close()
+
     def load_layout(self, layout_path: Path) -> bool:
         """Load a layout from file.
 
+        Parsed layouts are cached until the file changes on disk.
+
         Args:
             layout_path: Path to layout JSON file
 
@@ -103,15 +154,22 @@ class DisplayManager:
             True if loaded successfully
         """
         try:
-            with open(layout_path) as f:
-                layout_data = json.load(f)
-            self._layout = Layout.model_validate(layout_data)
-            logger.info(f"Loaded layout: {self._layout.name}")
-            return True
+            stat = layout_path.stat()
+            layout = _load_layout_cached(str(layout_path), stat.st_mtime_ns, stat.st_size)
         except (json.JSONDecodeError, ValueError, FileNotFoundError) as e:
             logger.error(f"Failed to load layout: {e}")
             return False
 
+        self._layout = layout
+        logger.info(f"Loaded layout: {layout.name}")
+
+        # Pre-draw the static widgets now instead of on the first render
+        try:
+            self._renderer.prepare(layout)
+        except ValueError as e:
+            logger.error(f"Failed to prepare layout: {e}")
+        return True
+
     def load_datasources(self, datasources_path: Optional[Path] = None) -> bool:
         """Load data sources from configuration.
 
@@ -128,26 +186,135 @@ class DisplayManager:
 
         try:
             self._data_manager.load_config(path)
+            # Render last-known values until the first refresh lands
+            self._last_data = self._data_manager.get_data_context()
             return True
         except Exception as e:
             logger.error(f"Failed to load data sources: {e}")
             return False
 
-    def _on_data_updated(self, data: dict[str, Any]) -> None:
+    async def _on_data_updated(self, data: dict[str, Any]) -> None:
         """Callback when data is updated by scheduler.
 
+        Sources refreshing at nearly the same time would each trigger a
+        full render and upload; the render is debounced so a burst of
+        updates produces one frame with the latest data.
+
         Args:
             data: Updated data context
         """
         self._last_data = data
         logger.debug("Data updated, triggering render")
 
-        # Render and send to device
-        if self._layout:
-            try:
-                self._render_and_send()
-            except Exception as e:
-                logger.error(f"Render failed: {e}")
+        if not self._layout:
+            return
+
+        if self._render_debounce <= 0:
+            await self._request_render()
+        elif self._render_pending is None:
+            loop = asyncio.get_running_loop()
+            self._render_pending = loop.call_later(self._render_debounce, self._flush_render)
+
+    def _flush_render(self) -> None:
+        """Start the render for a debounced burst of data updates."""
+        self._render_pending = None
+        if self._render_task is None or self._render_task.done():
+            self._render_task = asyncio.create_task(self._request_render())
+        else:
+            self._render_requested = True
+
+    async def _request_render(self) -> None:
+        """Render and send on the display worker thread.
+
+        Rendering and the device round-trip run off the event loop so other
+        refresh jobs are not stalled behind them. Only one render is in
+        flight at a time; requests arriving meanwhile collapse into a single
+        follow-up render of the latest data instead of queueing up.
+        """
+        if self._render_running:
+            self._render_requested = True
+            return
+
+        self._render_running = True
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                self._render_requested = False
+                try:
+                    await loop.run_in_executor(self._executor, self._render_and_send)
+                except Exception as e:
+                    logger.error(f"Render failed: {e}")
+                if not self._render_requested:
+                    break
+        finally:
+            self._render_running = False
+
+    def _send_frame(self, frame: Frame, skip_unchanged: bool = False) -> bool:
+        """Send a frame to the device if one is connected.
+
+        Args:
+            frame: Frame to send
+            skip_unchanged: Don't upload if the device already shows this frame
+
+        Returns:
+            True if sent successfully (or skipped as unchanged)
+        """
+        with self._render_lock:
+            rgb = frame.to_bytes()
+        return self._send_rgb(rgb, skip_unchanged)
+
+    def _send_rgb(self, rgb: bytes, skip_unchanged: bool = False) -> bool:
+        """Send packed RGB pixels to the device if one is connected.
+
+        Sends are serialized so frames from concurrent jobs arrive whole
+        and in order.
+
+        Args:
+            rgb: Snapshot of the frame as packed RGB bytes
+            skip_unchanged: Don't upload if the device already shows this frame
+
+        Returns:
+            True if sent successfully (or skipped as unchanged)
+        """
+        device = self._device
+        if device is None:
+            return False
+
+        try:
+            with self._send_lock:
+                if skip_unchanged and device.is_showing(rgb):
+                    logger.debug("Frame unchanged, skipping send")
+                    return True
+                device.send_rgb_bytes(rgb)
+            self._device_ok = True
+            logger.debug("Frame sent to device")
+            return True
+        except Exception as e:
+            self._device_ok = False
+            logger.error(f"Failed to send frame to device: {e}")
+            return False
+
+    def _call_device(self, method: str, *args: Any) -> Any:
+        """Call a Pixoo method, serialized with frame sends.
+
+        The device's HTTP session and PicID counter are not thread-safe, so
+        commands from the web UI take the same lock as frame uploads.
+
+        Args:
+            method: Name of the Pixoo method to call
+            *args: Positional arguments for the method
+
+        Returns:
+            The method's return value
+
+        Raises:
+            RuntimeError: If no device is connected
+        """
+        device = self._device
+        if device is None:
+            raise RuntimeError("No device connected")
+        with self._send_lock:
+            return getattr(device, method)(*args)
 
     def _render_and_send(self) -> None:
         """Render current layout and send to device."""
@@ -155,29 +322,53 @@ class DisplayManager:
             logger.warning("No layout loaded")
             return
 
-        # Render frame
-        self._current_frame = self._renderer.render(self._layout, self._last_data)
+        # Render frame, snapshotting it so the send doesn't hold the buffer
+        with self._render_lock:
+            self._current_frame = self._renderer.render(
+                self._layout, self._last_data, self._current_frame
+            )
+            rgb = self._current_frame.to_bytes()
 
         # Send to device if connected
-        if self._device:
-            try:
-                self._device.send_pixels(self._current_frame.to_pixels())
-                logger.debug("Frame sent to device")
-            except Exception as e:
-                logger.error(f"Failed to send frame to device: {e}")
+        self._send_rgb(rgb, skip_unchanged=True)
 
     def render(self) -> Optional[Frame]:
         """Render the current layout with current data.
 
+        The frame buffer is reused across renders, so the returned frame is
+        overwritten by the next one; use render_bytes() when the frame is
+        read while other threads may render.
+
         Returns:
             Rendered frame or None
         """
         if not self._layout:
             return None
 
-        self._current_frame = self._renderer.render(self._layout, self._last_data)
+        with self._render_lock:
+            self._current_frame = self._renderer.render(
+                self._layout, self._last_data, self._current_frame
+            )
         return self._current_frame
 
+    def render_bytes(self) -> Optional[bytes]:
+        """Render the current layout and snapshot it as packed RGB bytes.
+
+        Unlike render(), the snapshot is taken under the render lock, so a
+        render running on another thread can't leave it half-drawn.
+
+        Returns:
+            Packed RGB bytes (Frame.to_bytes()), or None if no layout is loaded
+        """
+        if not self._layout:
+            return None
+
+        with self._render_lock:
+            self._current_frame = self._renderer.render(
+                self._layout, self._last_data, self._current_frame
+            )
+            return self._current_frame.to_bytes()
+
     def send_to_device(self) -> bool:
         """Send current frame to device.
 
@@ -192,12 +383,36 @@ class DisplayManager:
             logger.warning("No device connected")
             return False
 
-        try:
-            self._device.send_pixels(self._current_frame.to_pixels())
-            return True
-        except Exception as e:
-            logger.error(f"Failed to send frame: {e}")
-            return False
+        return self._send_frame(self._current_frame)
+
+    async def _watch_device(self) -> None:
+        """Periodically verify the device and reconnect only when it is lost.
+
+        A successful send since the last check counts as proof of life, so
+        the device is only pinged when nothing has gone through, and
+        discovery only reruns when that ping fails. Consecutive failed
+        reconnects back off up to DEVICE_RECONNECT_MAX_INTERVAL, so a device
+        that is switched off doesn't trigger a subnet scan every check.
+        """
+        interval = DEVICE_CHECK_INTERVAL
+        while True:
+            await asyncio.sleep(interval)
+
+            if self._device_ok:
+                self._device_ok = False
+                interval = DEVICE_CHECK_INTERVAL
+                continue
+
+            if self._device is not None and await asyncio.to_thread(self._call_device, "ping"):
+                interval = DEVICE_CHECK_INTERVAL
+                continue
+
+            logger.warning("Device not responding, reconnecting...")
+            if await asyncio.to_thread(self.connect, self._connect_ip):
+                interval = DEVICE_CHECK_INTERVAL
+            else:
+                interval = min(interval * 2, DEVICE_RECONNECT_MAX_INTERVAL)
+                logger.info(f"Reconnect failed, next attempt in {interval:.0f}s")
 
     async def start(self) -> None:
         """Start the display manager with scheduled updates."""
@@ -209,17 +424,30 @@ class DisplayManager:
         # Add layout refresh job if layout has refresh_seconds
         if self._layout and self._layout.refresh_seconds:
             self._scheduler.add_job(
-                self._render_and_send,
+                self._request_render,
                 interval_seconds=self._layout.refresh_seconds,
                 job_id="layout_refresh",
                 name=f"Refresh display every {self._layout.refresh_seconds}s",
             )
 
+        # Watch the device bound at connect() time instead of rediscovering
+        if self._reconnect_enabled and self._watchdog_task is None:
+            self._watchdog_task = asyncio.create_task(self._watch_device())
+
         logger.info("Display manager started")
 
     def stop(self) -> None:
         """Stop the display manager."""
+        if self._render_pending is not None:
+            self._render_pending.cancel()
+            self._render_pending = None
+        # Drop queued renders; stop() runs on the loop, so don't block on one in flight
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._watchdog_task is not None:
+            self._watchdog_task.cancel()
+            self._watchdog_task = None
         self._scheduler.stop()
+        self._data_manager.close()
         logger.info("Display manager stopped")
 
     async def run_forever(self) -> None:
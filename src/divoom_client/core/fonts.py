@@ -1,7 +1,13 @@
 """Bitmap font support for pixel displays."""
 
+from collections import OrderedDict
 from typing import Optional
 
+import numpy as np
+
+# Rendered strings kept per font, least recently used evicted
+TEXT_MASK_CACHE_SIZE = 256
+
 # 5x7 bitmap font - each character is 5 pixels wide, 7 pixels tall
 # Each entry is a list of 7 integers, where each integer's bits represent the 5 columns
 FONT_5X7: dict[str, list[int]] = {
@@ -219,6 +225,9 @@ class BitmapFont:
         self.width = width
         self.height = height
         self.spacing = 1  # Pixels between characters
+        self._glyphs: dict[str, tuple[tuple[int, int], ...]] = {}
+        self._masks: dict[str, np.ndarray] = {}
+        self._text_masks: OrderedDict[str, np.ndarray] = OrderedDict()
 
     def get_char_bitmap(self, char: str) -> Optional[list[int]]:
         """Get bitmap data for a character.
@@ -245,6 +254,81 @@ class BitmapFont:
         width = len(text) * self.width + (len(text) - 1) * self.spacing
         return (width, self.height)
 
+    def glyph_points(self, char: str) -> tuple[tuple[int, int], ...]:
+        """Get the set pixel offsets for a character.
+
+        Offsets are decoded from the bitmap once per character and cached.
+
+        Args:
+            char: Character to look up
+
+        Returns:
+            Tuple of (x, y) offsets for set pixels, empty if character not found
+        """
+        points = self._glyphs.get(char)
+        if points is None:
+            bitmap = self.get_char_bitmap(char) or []
+            points = tuple(
+                (x, y)
+                for y, row in enumerate(bitmap)
+                for x in range(self.width)
+                # Check if bit is set (MSB first)
+                if row & (1 << (self.width - 1 - x))
+            )
+            self._glyphs[char] = points
+        return points
+
+    def glyph_mask(self, char: str) -> np.ndarray:
+        """Get a character as a boolean (height, width) mask of set pixels.
+
+        Masks are built once per character and cached; callers must not
+        modify them.
+
+        Args:
+            char: Character to look up
+
+        Returns:
+            Boolean array, all False if character not found
+        """
+        mask = self._masks.get(char)
+        if mask is None:
+            mask = np.zeros((self.height, self.width), dtype=bool)
+            for x, y in self.glyph_points(char):
+                mask[y, x] = True
+            mask.flags.writeable = False
+            self._masks[char] = mask
+        return mask
+
+    def text_mask(self, text: str) -> np.ndarray:
+        """Get a whole string as a boolean (height, width) mask of set pixels.
+
+        Glyphs are laid out with the font's spacing, so a string can be drawn
+        with one masked copy. Masks are cached per string (LRU-bounded);
+        callers must not modify them.
+
+        Args:
+            text: Text to lay out
+
+        Returns:
+            Boolean array as wide as measure_text reports
+        """
+        mask = self._text_masks.get(text)
+        if mask is not None:
+            self._text_masks.move_to_end(text)
+            return mask
+
+        width, _ = self.measure_text(text)
+        mask = np.zeros((self.height, width), dtype=bool)
+        advance = self.width + self.spacing
+        for i, char in enumerate(text):
+            mask[:, i * advance:i * advance + self.width] = self.glyph_mask(char)
+        mask.flags.writeable = False
+
+        self._text_masks[text] = mask
+        if len(self._text_masks) > TEXT_MASK_CACHE_SIZE:
+            self._text_masks.popitem(last=False)
+        return mask
+
     def render_char(
         self,
         char: str,
@@ -259,17 +343,7 @@ class BitmapFont:
         Returns:
             List of (x, y, color) tuples for set pixels
         """
-        bitmap = self.get_char_bitmap(char)
-        if not bitmap:
-            return []
-
-        pixels = []
-        for y, row in enumerate(bitmap):
-            for x in range(self.width):
-                # Check if bit is set (MSB first)
-                if row & (1 << (self.width - 1 - x)):
-                    pixels.append((x, y, color))
-        return pixels
+        return [(x, y, color) for x, y in self.glyph_points(char)]
 
 
 # Pre-defined font instances
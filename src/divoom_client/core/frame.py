@@ -1,15 +1,23 @@
 """Pixel buffer and frame management."""
 
-from typing import Optional
+import functools
+from typing import TYPE_CHECKING, Optional
 
+import numpy as np
 from PIL import Image
 
+if TYPE_CHECKING:
+    from divoom_client.core.fonts import BitmapFont
+
 PIXOO_SIZE = 64
 
 
+@functools.lru_cache(maxsize=512)
 def parse_color(color: str) -> tuple[int, int, int]:
     """Parse a hex color string to RGB tuple.
 
+    Layouts reuse a handful of colors, so results are memoized per string.
+
     Args:
         color: Hex color string (e.g., "#FF0000" or "FF0000")
 
@@ -26,6 +34,48 @@ def parse_color(color: str) -> tuple[int, int, int]:
     )
 
 
+@functools.lru_cache(maxsize=256)
+def _line_points(
+    x1: int, y1: int, x2: int, y2: int, width: int, height: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Rasterize a line with Bresenham's algorithm (vectorized).
+
+    Layout lines have fixed endpoints, so the pixel coordinates are
+    memoized and each draw is a single indexed assignment.
+
+    Args:
+        x1, y1: Start point
+        x2, y2: End point
+        width, height: Frame size to clip to
+
+    Returns:
+        (ys, xs) index arrays of the visible pixels
+    """
+    dx = abs(x2 - x1)
+    dy = abs(y2 - y1)
+    sx = 1 if x1 < x2 else -1
+    sy = 1 if y1 < y2 else -1
+
+    # Closed form of the Bresenham walk: one step per pixel along the
+    # major axis, minor axis offset rounded half down
+    major, minor = (dx, dy) if dx >= dy else (dy, dx)
+    steps = np.arange(major + 1)
+    if major:
+        offsets = (2 * steps * minor + major - 1) // (2 * major)
+    else:
+        offsets = steps
+    if dx >= dy:
+        xs, ys = x1 + sx * steps, y1 + sy * offsets
+    else:
+        xs, ys = x1 + sx * offsets, y1 + sy * steps
+
+    visible = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+    ys, xs = ys[visible], xs[visible]
+    ys.flags.writeable = False
+    xs.flags.writeable = False
+    return ys, xs
+
+
 class Frame:
     """A 64x64 pixel frame buffer for the Pixoo display."""
 
@@ -37,10 +87,11 @@ class Frame:
         """
         self.width = PIXOO_SIZE
         self.height = PIXOO_SIZE
-        bg = parse_color(background)
-        self._pixels: list[list[tuple[int, int, int]]] = [
-            [bg for _ in range(self.width)] for _ in range(self.height)
-        ]
+        # (height, width, 3) uint8 RGB buffer, row-major like the device expects.
+        # Kept interleaved: to_bytes/to_buffer and PIL need no repacking, and
+        # whole-frame math vectorizes just as well as on separate planes.
+        self._pixels = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        self._pixels[:] = parse_color(background)
 
     def set_pixel(self, x: int, y: int, color: tuple[int, int, int]) -> None:
         """Set a single pixel.
@@ -51,7 +102,7 @@ class Frame:
             color: RGB tuple
         """
         if 0 <= x < self.width and 0 <= y < self.height:
-            self._pixels[y][x] = color
+            self._pixels[y, x] = color
 
     def get_pixel(self, x: int, y: int) -> tuple[int, int, int]:
         """Get a single pixel.
@@ -64,7 +115,8 @@ class Frame:
             RGB tuple
         """
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self._pixels[y][x]
+            r, g, b = self._pixels[y, x].tolist()
+            return (r, g, b)
         return (0, 0, 0)
 
     def draw_rect(
@@ -86,19 +138,23 @@ class Frame:
             color: RGB tuple
             filled: If True, fill the rectangle; otherwise draw outline only
         """
+        x0, x1 = max(x, 0), min(x + width, self.width)
+        y0, y1 = max(y, 0), min(y + height, self.height)
+
         if filled:
-            for py in range(y, y + height):
-                for px in range(x, x + width):
-                    self.set_pixel(px, py, color)
+            if x0 < x1 and y0 < y1:
+                self._pixels[y0:y1, x0:x1] = color
         else:
             # Top and bottom edges
-            for px in range(x, x + width):
-                self.set_pixel(px, y, color)
-                self.set_pixel(px, y + height - 1, color)
+            if x0 < x1:
+                for row in (y, y + height - 1):
+                    if 0 <= row < self.height:
+                        self._pixels[row, x0:x1] = color
             # Left and right edges
-            for py in range(y, y + height):
-                self.set_pixel(x, py, color)
-                self.set_pixel(x + width - 1, py, color)
+            if y0 < y1:
+                for col in (x, x + width - 1):
+                    if 0 <= col < self.width:
+                        self._pixels[y0:y1, col] = color
 
     def draw_line(
         self,
@@ -108,31 +164,43 @@ class Frame:
         y2: int,
         color: tuple[int, int, int],
     ) -> None:
-        """Draw a line using Bresenham's algorithm.
+        """Draw a line using Bresenham's algorithm (vectorized).
 
         Args:
             x1, y1: Start point
             x2, y2: End point
             color: RGB tuple
         """
-        dx = abs(x2 - x1)
-        dy = abs(y2 - y1)
-        sx = 1 if x1 < x2 else -1
-        sy = 1 if y1 < y2 else -1
-        err = dx - dy
-
-        x, y = x1, y1
-        while True:
-            self.set_pixel(x, y, color)
-            if x == x2 and y == y2:
-                break
-            e2 = 2 * err
-            if e2 > -dy:
-                err -= dy
-                x += sx
-            if e2 < dx:
-                err += dx
-                y += sy
+        ys, xs = _line_points(x1, y1, x2, y2, self.width, self.height)
+        self._pixels[ys, xs] = color
+
+    def draw_text(
+        self,
+        x: int,
+        y: int,
+        text: str,
+        font: "BitmapFont",
+        color: tuple[int, int, int],
+    ) -> None:
+        """Draw a string with a bitmap font.
+
+        Args:
+            x: Left X coordinate of the first character
+            y: Top Y coordinate
+            text: Text to draw
+            font: Bitmap font to render with
+            color: RGB tuple
+        """
+        if not text:
+            return
+
+        mask = font.text_mask(text)
+        x0, x1 = max(x, 0), min(x + mask.shape[1], self.width)
+        y0, y1 = max(y, 0), min(y + font.height, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        self._pixels[y0:y1, x0:x1][mask[y0 - y:y1 - y, x0 - x:x1 - x]] = color
 
     def draw_image(
         self,
@@ -161,12 +229,15 @@ class Frame:
         if image.mode != "RGBA":
             image = image.convert("RGBA")
 
-        # Draw pixels
-        for py in range(image.height):
-            for px in range(image.width):
-                r, g, b, a = image.getpixel((px, py))
-                if a > 128:  # Simple alpha threshold
-                    self.set_pixel(x + px, y + py, (r, g, b))
+        # Clip the image to the frame
+        x0, x1 = max(x, 0), min(x + image.width, self.width)
+        y0, y1 = max(y, 0), min(y + image.height, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        src = np.asarray(image)[y0 - y:y1 - y, x0 - x:x1 - x]
+        mask = src[:, :, 3] > 128  # Simple alpha threshold
+        self._pixels[y0:y1, x0:x1][mask] = src[:, :, :3][mask]
 
     def clear(self, color: str = "#000000") -> None:
         """Clear the frame with a solid color.
@@ -174,10 +245,15 @@ class Frame:
         Args:
             color: Fill color as hex string
         """
-        c = parse_color(color)
-        for y in range(self.height):
-            for x in range(self.width):
-                self._pixels[y][x] = c
+        self._pixels[:] = parse_color(color)
+
+    def copy_from(self, other: "Frame") -> None:
+        """Overwrite this frame with the pixels of another frame.
+
+        Args:
+            other: Source frame
+        """
+        np.copyto(self._pixels, other._pixels)
 
     def to_pixels(self) -> list[tuple[int, int, int]]:
         """Convert frame to flat pixel list for Pixoo.
@@ -185,22 +261,39 @@ class Frame:
         Returns:
             List of 4096 RGB tuples in row-major order
         """
-        pixels = []
-        for row in self._pixels:
-            pixels.extend(row)
-        return pixels
+        return [(r, g, b) for r, g, b in self._pixels.reshape(-1, 3).tolist()]
+
+    def to_bytes(self) -> bytes:
+        """Convert frame to packed RGB bytes for Pixoo.
+
+        Returns:
+            12288 bytes of row-major R, G, B values
+        """
+        return self._pixels.tobytes()
+
+    def to_buffer(self) -> memoryview:
+        """Get a zero-copy, read-only view of the packed RGB bytes.
+
+        The view tracks the frame, so it must be used before the frame is
+        drawn on again.
+
+        Returns:
+            12288-byte memoryview of row-major R, G, B values
+        """
+        return self._pixels.data.toreadonly().cast("B")
 
     def to_image(self) -> Image.Image:
         """Convert frame to PIL Image.
 
+        The pixel buffer is handed to PIL in a single raw decode; PIL copies
+        it, so later drawing on the frame does not affect the image.
+
         Returns:
             64x64 RGB PIL Image
         """
-        img = Image.new("RGB", (self.width, self.height))
-        for y in range(self.height):
-            for x in range(self.width):
-                img.putpixel((x, y), self._pixels[y][x])
-        return img
+        return Image.frombuffer(
+            "RGB", (self.width, self.height), self._pixels, "raw", "RGB", 0, 1
+        )
 
     def save(self, path: str) -> None:
         """Save frame as image file.
@@ -1,17 +1,52 @@
 """Pixoo device communication."""
 
-import base64
+import itertools
+import json
 import logging
-from io import BytesIO
-from typing import Optional
+import time
+from typing import Any, Optional, Union
 
 import requests
 from PIL import Image
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from pybase64 import b64encode
+except ImportError:  # Optional speedup, see the "fast" extra
+    from base64 import b64encode
+
 logger = logging.getLogger(__name__)
 
 PIXOO_SIZE = 64
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Frames sent between HTTP GIF buffer resets. The device expects increasing
+# PicIDs after a reset and stops updating if the buffer is never reset.
+GIF_RESET_INTERVAL = 32
+
+# Seconds after which an unchanged frame is sent again anyway, in case the
+# display was changed from outside this client (e.g. the Divoom app)
+FRAME_RESEND_INTERVAL = 300.0
+
+
+def _dumps(command: dict[str, Any]) -> bytes:
+    """Encode a command as a JSON request body."""
+    if orjson is not None:
+        return orjson.dumps(command)
+    return json.dumps(command, separators=(",", ":")).encode()
+
+
+def _loads(body: bytes) -> Any:
+    """Decode a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
 
 class Pixoo:
     """Client for communicating with Pixoo 64 devices."""
@@ -29,6 +64,37 @@ class Pixoo:
         self.timeout = timeout
         self._base_url = f"http://{ip_address}:80/post"
 
+        # PicID of the last frame sent since the last reset (None = reset needed)
+        self._pic_id: Optional[int] = None
+
+        # Last frame known to be on the display, and when it was sent
+        self._last_rgb: Optional[bytes] = None
+        self._last_rgb_at = 0.0
+
+        # Keep the connection alive across the reset/send/brightness sequence
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        self._session.mount("http://", adapter)
+
+    def is_showing(self, rgb: Union[bytes, memoryview]) -> bool:
+        """Check whether a frame is already on the display.
+
+        Args:
+            rgb: Packed RGB frame bytes (or byte-format buffer)
+
+        Returns:
+            True if this client last sent the same frame, recently enough
+            that resending it is pointless
+        """
+        return (
+            self._last_rgb == rgb
+            and time.monotonic() - self._last_rgb_at < FRAME_RESEND_INTERVAL
+        )
+
+    def close(self) -> None:
+        """Close the pooled HTTP connection to the device."""
+        self._session.close()
+
     def _send_command(self, command: dict) -> dict:
         """Send a command to the Pixoo device.
 
@@ -43,19 +109,20 @@ class Pixoo:
             ValueError: If device returns an error
         """
         try:
-            response = requests.post(
+            response = self._session.post(
                 self._base_url,
-                json=command,
+                data=_dumps(command),
+                headers=_JSON_HEADERS,
                 timeout=self.timeout,
             )
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response.content)
 
             if data.get("error_code", 0) != 0:
                 raise ValueError(f"Device error: {data}")
 
             return data
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
             raise ConnectionError(f"Failed to connect to Pixoo at {self.ip_address}: {e}") from e
 
     def get_device_info(self) -> dict:
@@ -99,6 +166,7 @@ class Pixoo:
         Returns:
             Response from device
         """
+        self._last_rgb = None
         return self._send_command({
             "Command": "Channel/OnOffScreen",
             "OnOff": 1 if on else 0,
@@ -113,6 +181,7 @@ class Pixoo:
         Returns:
             Response from device
         """
+        self._last_rgb = None
         return self._send_command({
             "Command": "Channel/SetIndex",
             "SelectIndex": channel,
@@ -124,7 +193,9 @@ class Pixoo:
         Returns:
             Response from device
         """
-        return self._send_command({"Command": "Draw/ResetHttpGifId"})
+        response = self._send_command({"Command": "Draw/ResetHttpGifId"})
+        self._pic_id = 0
+        return response
 
     def send_image(self, image: Image.Image, pic_num: int = 0) -> dict:
         """Send an image to the display.
@@ -136,21 +207,20 @@ class Pixoo:
         Returns:
             Response from device
         """
-        # Reset buffer before sending
-        self.reset_gif()
-
         if image.size != (PIXOO_SIZE, PIXOO_SIZE):
             image = image.resize((PIXOO_SIZE, PIXOO_SIZE), Image.Resampling.NEAREST)
 
         if image.mode != "RGB":
             image = image.convert("RGB")
 
-        pixels = list(image.getdata())
-        pixel_data = []
-        for r, g, b in pixels:
-            pixel_data.extend([r, g, b])
+        if pic_num == 0:
+            return self.send_rgb_bytes(image.tobytes())
+
+        # Reset buffer before sending
+        self._last_rgb = None
+        self.reset_gif()
 
-        encoded = base64.b64encode(bytes(pixel_data)).decode("ascii")
+        encoded = b64encode(image.tobytes()).decode("ascii")
 
         return self._send_command({
             "Command": "Draw/SendHttpGif",
@@ -162,36 +232,60 @@ class Pixoo:
             "PicData": encoded,
         })
 
-    def send_pixels(self, pixels: list[tuple[int, int, int]]) -> dict:
-        """Send raw pixel data to the display.
+    def send_rgb_bytes(self, rgb: Union[bytes, memoryview]) -> dict[str, Any]:
+        """Send packed RGB pixel data to the display.
+
+        Frames are numbered with increasing PicIDs; the device's GIF buffer
+        is reset before the first frame and then every GIF_RESET_INTERVAL
+        frames, rather than before every frame.
 
         Args:
-            pixels: List of (R, G, B) tuples, 64x64 = 4096 pixels
+            rgb: Row-major R, G, B bytes, 64x64x3 = 12288 bytes. Any
+                byte-format buffer works, e.g. Frame.to_buffer(); it is
+                base64-encoded in place without an intermediate copy.
 
         Returns:
             Response from device
         """
-        if len(pixels) != PIXOO_SIZE * PIXOO_SIZE:
-            raise ValueError(f"Expected {PIXOO_SIZE * PIXOO_SIZE} pixels, got {len(pixels)}")
-
-        # Reset buffer before sending
-        self.reset_gif()
+        if len(rgb) != PIXOO_SIZE * PIXOO_SIZE * 3:
+            raise ValueError(f"Expected {PIXOO_SIZE * PIXOO_SIZE * 3} bytes, got {len(rgb)}")
 
-        pixel_data = []
-        for r, g, b in pixels:
-            pixel_data.extend([r, g, b])
+        pic_id = self._pic_id
+        if pic_id is None or pic_id >= GIF_RESET_INTERVAL:
+            self.reset_gif()
+            pic_id = 0
+        pic_id += 1
+        self._pic_id = pic_id
 
-        encoded = base64.b64encode(bytes(pixel_data)).decode("ascii")
+        encoded = b64encode(rgb).decode("ascii")
 
-        return self._send_command({
+        self._last_rgb = None
+        response = self._send_command({
             "Command": "Draw/SendHttpGif",
             "PicNum": 1,
             "PicWidth": PIXOO_SIZE,
             "PicOffset": 0,
-            "PicID": 0,
+            "PicID": pic_id,
             "PicSpeed": 1000,
             "PicData": encoded,
         })
+        self._last_rgb = bytes(rgb)
+        self._last_rgb_at = time.monotonic()
+        return response
+
+    def send_pixels(self, pixels: list[tuple[int, int, int]]) -> dict:
+        """Send raw pixel data to the display.
+
+        Args:
+            pixels: List of (R, G, B) tuples, 64x64 = 4096 pixels
+
+        Returns:
+            Response from device
+        """
+        if len(pixels) != PIXOO_SIZE * PIXOO_SIZE:
+            raise ValueError(f"Expected {PIXOO_SIZE * PIXOO_SIZE} pixels, got {len(pixels)}")
+
+        return self.send_rgb_bytes(bytes(itertools.chain.from_iterable(pixels)))
 
     def clear(self, color: tuple[int, int, int] = (0, 0, 0)) -> dict:
         """Clear the display with a solid color.
@@ -202,8 +296,7 @@ class Pixoo:
         Returns:
             Response from device
         """
-        pixels = [color] * (PIXOO_SIZE * PIXOO_SIZE)
-        return self.send_pixels(pixels)
+        return self.send_rgb_bytes(bytes(color) * (PIXOO_SIZE * PIXOO_SIZE))
 
     def ping(self) -> bool:
         """Check if device is reachable.
@@ -1,15 +1,18 @@
 """Layout renderer for Pixoo displays."""
 
+import functools
 import logging
+import operator
 import re
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Callable, Optional, Union
 
 from PIL import Image
 
 from divoom_client.core.fonts import get_font
-from divoom_client.core.frame import Frame, parse_color
+from divoom_client.core.frame import PIXOO_SIZE, Frame, parse_color
 from divoom_client.models.layout import (
     ClockWidget,
     ConditionalColor,
@@ -24,6 +27,215 @@ from divoom_client.models.layout import (
 
 logger = logging.getLogger(__name__)
 
+# Pattern: variable operator value
+# Allow special chars like ^ and = in stock symbols (e.g., ^GSPC, GC=F)
+# Use specific operators to avoid confusion with = in symbol names
+_EXPRESSION_RE = re.compile(r"^\s*([\w.^=]+)\s*(==|!=|<=|>=|<|>)\s*(.+)\s*$")
+
+# Decoded images (and scaled variants) kept per renderer, least recently used evicted
+IMAGE_CACHE_SIZE = 64
+
+# {data.path} placeholders in image sources
+_PLACEHOLDER_RE = re.compile(r"\{([^}]+)\}")
+
+_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+# (layout, template frame with the static widgets drawn, widgets left to draw,
+#  whether any of those reads the data context through an evaluator)
+RenderPlan = tuple[Layout, Frame, list[Widget], bool]
+
+
+def _is_static(widget: Widget) -> bool:
+    """Check whether a widget draws the same pixels regardless of data and time."""
+    if isinstance(widget, (ClockWidget, DateWidget)):
+        return False
+    if isinstance(widget, ImageWidget):
+        return "{" not in widget.src
+    if not isinstance(widget.color, str):
+        return False
+    if isinstance(widget, TextWidget):
+        return widget.data_source is None
+    return True
+
+
+def _needs_evaluator(widget: Widget) -> bool:
+    """Check whether a widget looks up data values or evaluates conditions."""
+    if isinstance(widget, ImageWidget):
+        return False
+    if isinstance(widget, TextWidget) and widget.data_source is not None:
+        return True
+    return not isinstance(widget.color, str)
+
+
+def _widget_bounds(widget: Widget) -> tuple[int, int, int, int]:
+    """Get a conservative (x0, y0, x1, y1) box for the pixels a widget may touch."""
+    if isinstance(widget, RectWidget):
+        return widget.x, widget.y, widget.x + widget.width, widget.y + widget.height
+    if isinstance(widget, LineWidget):
+        return (
+            min(widget.x1, widget.x2),
+            min(widget.y1, widget.y2),
+            max(widget.x1, widget.x2) + 1,
+            max(widget.y1, widget.y2) + 1,
+        )
+    if isinstance(widget, ImageWidget):
+        return widget.x, widget.y, PIXOO_SIZE, PIXOO_SIZE
+    # Text-like widgets: text length may vary, so assume it runs to the edge
+    try:
+        height = get_font(widget.font).height
+    except ValueError:
+        return 0, 0, PIXOO_SIZE, PIXOO_SIZE
+    return widget.x, widget.y, PIXOO_SIZE, widget.y + height
+
+
+def _overlaps(a: tuple[int, int, int, int], b: tuple[int, int, int, int]) -> bool:
+    """Check whether two (x0, y0, x1, y1) boxes intersect."""
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_expression(expression: str) -> Optional[tuple[str, str, Any]]:
+    """Parse a conditional expression once.
+
+    Layouts reuse the same handful of conditions every frame, so parsed
+    expressions are memoized per string.
+
+    Args:
+        expression: Expression string (e.g., "stocks.AAPL.change < 0")
+
+    Returns:
+        (variable path, operator, comparison value), or None if invalid
+    """
+    match = _EXPRESSION_RE.match(expression)
+    if not match:
+        return None
+
+    var_path, op, value_str = match.groups()
+
+    # Parse the comparison value
+    try:
+        if value_str.strip().lower() in ("true", "false"):
+            compare_value = value_str.strip().lower() == "true"
+        elif "." in value_str:
+            compare_value = float(value_str)
+        else:
+            compare_value = int(value_str)
+    except ValueError:
+        compare_value = value_str.strip().strip("'\"")
+
+    return var_path, op, compare_value
+
+
+@functools.lru_cache(maxsize=512)
+def _split_path(path: str) -> tuple[str, ...]:
+    """Split a dot-separated data path, memoized per path string."""
+    return tuple(path.split("."))
+
+
+def _precompile(widget: Widget) -> None:
+    """Parse a widget's data path, colors and conditions ahead of its first render.
+
+    Fills the _split_path, _compile_expression and parse_color caches so
+    per-frame lookups are cache hits, and reports invalid conditions and
+    colors once up front.
+
+    Args:
+        widget: Widget drawn per render
+    """
+    if isinstance(widget, TextWidget) and widget.data_source:
+        _split_path(widget.data_source)
+    color = getattr(widget, "color", None)
+    if color is None:
+        return
+
+    colors = [color]
+    if isinstance(color, ConditionalColor):
+        colors = [condition.color for condition in color.conditions] + [color.default]
+        for condition in color.conditions:
+            compiled = _compile_expression(condition.when)
+            if compiled is None:
+                logger.warning(f"Invalid expression in widget {widget.id}: {condition.when}")
+            else:
+                _split_path(compiled[0])
+
+    for value in colors:
+        try:
+            parse_color(value)
+        except ValueError:
+            logger.warning(f"Invalid color in widget {widget.id}: {value}")
+
+
+@functools.lru_cache(maxsize=8)
+def _us_dst_window(year: int) -> tuple[datetime, datetime]:
+    """Get the US daylight saving time window for a year.
+
+    Simple DST detection for US timezones: DST runs from the second Sunday
+    in March to the first Sunday in November, both at 2 AM. Cached per year
+    since clocks ask every frame.
+
+    Args:
+        year: Calendar year
+
+    Returns:
+        (dst_start, dst_end) as UTC datetimes
+    """
+    # Find second Sunday in March
+    march_first = datetime(year, 3, 1, tzinfo=timezone.utc)
+    days_to_sunday = (6 - march_first.weekday()) % 7
+    dst_start = march_first + timedelta(days=days_to_sunday + 7)  # Second Sunday
+    dst_start = dst_start.replace(hour=2)  # 2 AM
+
+    # Find first Sunday in November
+    nov_first = datetime(year, 11, 1, tzinfo=timezone.utc)
+    days_to_sunday = (6 - nov_first.weekday()) % 7
+    dst_end = nov_first + timedelta(days=days_to_sunday)  # First Sunday
+    dst_end = dst_end.replace(hour=2)  # 2 AM
+
+    return dst_start, dst_end
+
+
+@functools.lru_cache(maxsize=32)
+def _fixed_timezone(offset_hours: float) -> timezone:
+    """Get a fixed-offset timezone, shared across frames."""
+    return timezone(timedelta(hours=offset_hours))
+
+
+def _local_time(timezone_offset: float, auto_dst: bool) -> datetime:
+    """Get the current time shifted by a fixed UTC offset.
+
+    Args:
+        timezone_offset: UTC offset in hours
+        auto_dst: Add an hour while US daylight saving time is in effect
+
+    Returns:
+        Current time in the fixed-offset timezone
+    """
+    # Get current UTC time
+    now_utc = datetime.now(timezone.utc)
+
+    # Apply timezone offset
+    offset_hours = timezone_offset
+
+    # Handle DST if auto_dst is enabled
+    if auto_dst:
+        dst_start, dst_end = _us_dst_window(now_utc.year)
+        if dst_start <= now_utc < dst_end:
+            offset_hours += 1  # Add 1 hour for DST
+
+    # Apply offset
+    try:
+        return now_utc.astimezone(_fixed_timezone(offset_hours))
+    except ValueError:
+        # Offsets of a day or more can't be a timezone; shift the UTC time
+        return now_utc + timedelta(hours=offset_hours)
+
 
 class ExpressionEvaluator:
     """Simple expression evaluator for conditional formatting."""
@@ -31,10 +243,15 @@ class ExpressionEvaluator:
     def __init__(self, data: dict[str, Any]):
         """Initialize with data context.
 
+        The renderer creates one evaluator per frame, so condition results
+        are memoized for its lifetime; widgets sharing a condition (e.g. a
+        price and its change colored by the same test) evaluate it once.
+
         Args:
             data: Data dictionary for variable lookups (e.g., {"stocks": {"AAPL": {"price": 150}}})
         """
         self.data = data
+        self._results: dict[str, bool] = {}
 
     def get_value(self, path: str) -> Any:
         """Get a value from the data context using dot notation.
@@ -45,13 +262,11 @@ class ExpressionEvaluator:
         Returns:
             Value at path, or None if not found
         """
-        parts = path.split(".")
         current = self.data
-        for part in parts:
-            if isinstance(current, dict):
-                current = current.get(part)
-            else:
+        for part in _split_path(path):
+            if not isinstance(current, dict):
                 return None
+            current = current.get(part)
             if current is None:
                 return None
         return current
@@ -68,52 +283,30 @@ class ExpressionEvaluator:
         Returns:
             Boolean result
         """
-        # Pattern: variable operator value
-        # Allow special chars like ^ and = in stock symbols (e.g., ^GSPC, GC=F)
-        # Use specific operators to avoid confusion with = in symbol names
-        pattern = r"^\s*([\w.^=]+)\s*(==|!=|<=|>=|<|>)\s*(.+)\s*$"
-        match = re.match(pattern, expression)
-        if not match:
+        result = self._results.get(expression)
+        if result is None:
+            result = self._results[expression] = self._evaluate(expression)
+        return result
+
+    def _evaluate(self, expression: str) -> bool:
+        """Evaluate an expression against the data, without memoization."""
+        compiled = _compile_expression(expression)
+        if compiled is None:
             logger.warning(f"Invalid expression: {expression}")
             return False
 
-        var_path, operator, value_str = match.groups()
+        var_path, op, compare_value = compiled
         var_value = self.get_value(var_path)
 
         if var_value is None:
             logger.debug(f"Variable not found: {var_path}")
             return False
 
-        # Parse the comparison value
-        try:
-            if value_str.strip().lower() in ("true", "false"):
-                compare_value = value_str.strip().lower() == "true"
-            elif "." in value_str:
-                compare_value = float(value_str)
-            else:
-                compare_value = int(value_str)
-        except ValueError:
-            compare_value = value_str.strip().strip("'\"")
-
         # Evaluate comparison
         try:
-            if operator == "<":
-                return var_value < compare_value
-            elif operator == ">":
-                return var_value > compare_value
-            elif operator == "<=":
-                return var_value <= compare_value
-            elif operator == ">=":
-                return var_value >= compare_value
-            elif operator == "==":
-                return var_value == compare_value
-            elif operator == "!=":
-                return var_value != compare_value
-            else:
-                logger.warning(f"Unknown operator: {operator}")
-                return False
+            return _OPERATORS[op](var_value, compare_value)
         except TypeError:
-            logger.warning(f"Type mismatch in comparison: {var_value} {operator} {compare_value}")
+            logger.warning(f"Type mismatch in comparison: {var_value} {op} {compare_value}")
             return False
 
 
@@ -127,18 +320,35 @@ class Renderer:
             assets_dir: Directory containing image assets (icons, etc.)
         """
         self.assets_dir = assets_dir or Path("assets")
-        self._image_cache: dict[str, Image.Image] = {}
+        # Decoded RGBA images by resolved source, and scaled copies of them.
+        # Placeholder sources can resolve to many paths, so both are LRU-bounded.
+        self._image_cache: OrderedDict[str, Image.Image] = OrderedDict()
+        self._scaled_cache: OrderedDict[
+            tuple[str, Optional[int], Optional[int]], Image.Image
+        ] = OrderedDict()
+        self._plan: Optional[RenderPlan] = None
+
+        # Widget type -> handler taking (widget, frame, data, evaluator)
+        self._handlers: dict[type, Callable[..., None]] = {
+            TextWidget: self.render_text_widget,
+            RectWidget: lambda w, f, d, e: self.render_rect_widget(w, f, e),
+            LineWidget: lambda w, f, d, e: self.render_line_widget(w, f, e),
+            ImageWidget: lambda w, f, d, e: self.render_image_widget(w, f, d),
+            ClockWidget: lambda w, f, d, e: self.render_clock_widget(w, f, e),
+            DateWidget: lambda w, f, d, e: self.render_date_widget(w, f, e),
+        }
 
     def resolve_color(
         self,
         color: Union[str, ConditionalColor],
-        evaluator: ExpressionEvaluator,
+        evaluator: Optional[ExpressionEvaluator],
     ) -> tuple[int, int, int]:
         """Resolve a color value, evaluating conditions if needed.
 
         Args:
             color: Static color string or ConditionalColor
-            evaluator: Expression evaluator with data context
+            evaluator: Expression evaluator with data context (may be None
+                for a plain color string)
 
         Returns:
             RGB tuple
@@ -146,10 +356,12 @@ class Renderer:
         if isinstance(color, str):
             return parse_color(color)
 
-        # Evaluate conditions in order
-        for condition in color.conditions:
-            if evaluator.evaluate(condition.when):
-                return parse_color(condition.color)
+        # Evaluate conditions in order (the plan always supplies an
+        # evaluator when a layout has conditional colors)
+        if evaluator is not None:
+            for condition in color.conditions:
+                if evaluator.evaluate(condition.when):
+                    return parse_color(condition.color)
 
         return parse_color(color.default)
 
@@ -177,25 +389,52 @@ class Renderer:
             data: Data context for placeholder substitution
 
         Returns:
-            PIL Image or None if load fails
+            Decoded RGBA PIL Image or None if load fails
         """
-        # Substitute data placeholders in path
+        return self._load_image(self._resolve_image_src(src, data))
+
+    def _resolve_image_src(self, src: str, data: dict[str, Any]) -> str:
+        """Substitute {data.path} placeholders in an image source path.
+
+        Args:
+            src: Image source path
+            data: Data context for placeholder substitution
+
+        Returns:
+            Resolved source path
+        """
+        # Most sources are fixed icon paths; skip the regex for those
+        if "{" not in src:
+            return src
+
         def replace_placeholder(match: re.Match) -> str:
-            path = match.group(1)
-            parts = path.split(".")
             current = data
-            for part in parts:
+            for part in _split_path(match.group(1)):
                 if isinstance(current, dict):
                     current = current.get(part, "")
                 else:
                     return ""
             return str(current)
 
-        resolved_src = re.sub(r"\{([^}]+)\}", replace_placeholder, src)
+        return _PLACEHOLDER_RE.sub(replace_placeholder, src)
 
+    def _load_image(self, resolved_src: str) -> Optional[Image.Image]:
+        """Load and decode an image, cached by resolved source path.
+
+        The image is fully decoded to RGBA and its file closed, so renders
+        never go back to disk or repeat the conversion.
+
+        Args:
+            resolved_src: Source path with placeholders already substituted
+
+        Returns:
+            RGBA PIL Image or None if load fails
+        """
         # Check cache
-        if resolved_src in self._image_cache:
-            return self._image_cache[resolved_src]
+        img = self._image_cache.get(resolved_src)
+        if img is not None:
+            self._image_cache.move_to_end(resolved_src)
+            return img
 
         # Try loading from assets directory
         image_path = self.assets_dir / resolved_src
@@ -208,19 +447,57 @@ class Renderer:
             return None
 
         try:
-            img = Image.open(image_path)
+            with Image.open(image_path) as f:
+                img = f.convert("RGBA")
             self._image_cache[resolved_src] = img
+            if len(self._image_cache) > IMAGE_CACHE_SIZE:
+                self._image_cache.popitem(last=False)
             return img
         except Exception as e:
             logger.error(f"Failed to load image {image_path}: {e}")
             return None
 
+    def _scaled_image(
+        self,
+        resolved_src: str,
+        width: Optional[int],
+        height: Optional[int],
+    ) -> Optional[Image.Image]:
+        """Get an image scaled to a widget's size, cached per size.
+
+        Args:
+            resolved_src: Source path with placeholders already substituted
+            width: Scale width (None = original)
+            height: Scale height (None = original)
+
+        Returns:
+            RGBA PIL Image or None if load fails
+        """
+        if not (width or height):
+            return self._load_image(resolved_src)
+
+        key = (resolved_src, width, height)
+        scaled = self._scaled_cache.get(key)
+        if scaled is not None:
+            self._scaled_cache.move_to_end(key)
+            return scaled
+
+        img = self._load_image(resolved_src)
+        if img is None:
+            return None
+        size = (width or img.width, height or img.height)
+        scaled = img.resize(size, Image.Resampling.NEAREST)
+        self._scaled_cache[key] = scaled
+        if len(self._scaled_cache) > IMAGE_CACHE_SIZE:
+            self._scaled_cache.popitem(last=False)
+        return scaled
+
     def render_text_widget(
         self,
         widget: TextWidget,
         frame: Frame,
         data: dict[str, Any],
-        evaluator: ExpressionEvaluator,
+        evaluator: Optional[ExpressionEvaluator],
     ) -> None:
         """Render a text widget to the frame.
 
@@ -232,7 +509,7 @@ class Renderer:
         """
         # Get text content
         if widget.data_source:
-            value = evaluator.get_value(widget.data_source)
+            value = evaluator.get_value(widget.data_source) if evaluator is not None else None
             text = self.format_value(widget.format, value)
         else:
             text = widget.text or ""
@@ -244,19 +521,13 @@ class Renderer:
         font = get_font(widget.font)
         color = self.resolve_color(widget.color, evaluator)
 
-        # Render each character
-        x_offset = widget.x
-        for char in text:
-            pixels = font.render_char(char, color)
-            for px, py, c in pixels:
-                frame.set_pixel(x_offset + px, widget.y + py, c)
-            x_offset += font.width + font.spacing
+        frame.draw_text(widget.x, widget.y, text, font, color)
 
     def render_rect_widget(
         self,
         widget: RectWidget,
         frame: Frame,
-        evaluator: ExpressionEvaluator,
+        evaluator: Optional[ExpressionEvaluator],
     ) -> None:
         """Render a rectangle widget to the frame.
 
@@ -272,7 +543,7 @@ class Renderer:
         self,
         widget: LineWidget,
         frame: Frame,
-        evaluator: ExpressionEvaluator,
+        evaluator: Optional[ExpressionEvaluator],
     ) -> None:
         """Render a line widget to the frame.
 
@@ -297,15 +568,16 @@ class Renderer:
             frame: Target frame
             data: Data context for path substitution
         """
-        img = self.load_image(widget.src, data)
+        resolved_src = self._resolve_image_src(widget.src, data)
+        img = self._scaled_image(resolved_src, widget.width, widget.height)
         if img:
-            frame.draw_image(widget.x, widget.y, img, widget.width, widget.height)
+            frame.draw_image(widget.x, widget.y, img)
 
     def render_clock_widget(
         self,
         widget: ClockWidget,
         frame: Frame,
-        evaluator: ExpressionEvaluator,
+        evaluator: Optional[ExpressionEvaluator],
     ) -> None:
         """Render a clock widget to the frame.
 
@@ -314,71 +586,31 @@ class Renderer:
             frame: Target frame
             evaluator: Expression evaluator
         """
-        # Get current UTC time
-        now_utc = datetime.now(timezone.utc)
-
-        # Apply timezone offset
-        offset_hours = widget.timezone_offset
-
-        # Handle DST if auto_dst is enabled
-        if widget.auto_dst:
-            # Simple DST detection for US timezones
-            # DST runs from second Sunday in March to first Sunday in November
-            year = now_utc.year
-
-            # Find second Sunday in March
-            march_first = datetime(year, 3, 1, tzinfo=timezone.utc)
-            days_to_sunday = (6 - march_first.weekday()) % 7
-            dst_start = march_first + timedelta(days=days_to_sunday + 7)  # Second Sunday
-            dst_start = dst_start.replace(hour=2)  # 2 AM
-
-            # Find first Sunday in November
-            nov_first = datetime(year, 11, 1, tzinfo=timezone.utc)
-            days_to_sunday = (6 - nov_first.weekday()) % 7
-            dst_end = nov_first + timedelta(days=days_to_sunday)  # First Sunday
-            dst_end = dst_end.replace(hour=2)  # 2 AM
-
-            # Check if we're in DST period
-            if dst_start <= now_utc < dst_end:
-                offset_hours += 1  # Add 1 hour for DST
-
-        # Apply offset
-        local_time = now_utc + timedelta(hours=offset_hours)
+        local_time = _local_time(widget.timezone_offset, widget.auto_dst)
 
         # Format time string
+        hour, minute = local_time.hour, local_time.minute
         if widget.format_24h:
-            if widget.show_seconds:
-                time_str = local_time.strftime("%H:%M:%S")
-            else:
-                time_str = local_time.strftime("%H:%M")
+            time_str = f"{hour:02d}:{minute:02d}"
         else:
-            if widget.show_seconds:
-                time_str = local_time.strftime("%I:%M:%S")
-            else:
-                time_str = local_time.strftime("%I:%M")
-            # Remove leading zero from hour for 12-hour format
-            if time_str.startswith("0"):
-                time_str = time_str[1:]
-            # Add AM/PM
-            time_str += local_time.strftime("%p").lower()[:1]  # 'a' or 'p'
+            # 12-hour format without a leading zero
+            time_str = f"{hour % 12 or 12}:{minute:02d}"
+        if widget.show_seconds:
+            time_str += f":{local_time.second:02d}"
+        if not widget.format_24h:
+            time_str += "a" if hour < 12 else "p"
 
         # Get font and color
         font = get_font(widget.font)
         color = self.resolve_color(widget.color, evaluator)
 
-        # Render each character
-        x_offset = widget.x
-        for char in time_str:
-            pixels = font.render_char(char, color)
-            for px, py, c in pixels:
-                frame.set_pixel(x_offset + px, widget.y + py, c)
-            x_offset += font.width + font.spacing
+        frame.draw_text(widget.x, widget.y, time_str, font, color)
 
     def render_date_widget(
         self,
         widget: DateWidget,
         frame: Frame,
-        evaluator: ExpressionEvaluator,
+        evaluator: Optional[ExpressionEvaluator],
     ) -> None:
         """Render a date widget to the frame.
 
@@ -387,36 +619,7 @@ class Renderer:
             frame: Target frame
             evaluator: Expression evaluator
         """
-        # Get current UTC time
-        now_utc = datetime.now(timezone.utc)
-
-        # Apply timezone offset
-        offset_hours = widget.timezone_offset
-
-        # Handle DST if auto_dst is enabled
-        if widget.auto_dst:
-            # Simple DST detection for US timezones
-            # DST runs from second Sunday in March to first Sunday in November
-            year = now_utc.year
-
-            # Find second Sunday in March
-            march_first = datetime(year, 3, 1, tzinfo=timezone.utc)
-            days_to_sunday = (6 - march_first.weekday()) % 7
-            dst_start = march_first + timedelta(days=days_to_sunday + 7)  # Second Sunday
-            dst_start = dst_start.replace(hour=2)  # 2 AM
-
-            # Find first Sunday in November
-            nov_first = datetime(year, 11, 1, tzinfo=timezone.utc)
-            days_to_sunday = (6 - nov_first.weekday()) % 7
-            dst_end = nov_first + timedelta(days=days_to_sunday)  # First Sunday
-            dst_end = dst_end.replace(hour=2)  # 2 AM
-
-            # Check if we're in DST period
-            if dst_start <= now_utc < dst_end:
-                offset_hours += 1  # Add 1 hour for DST
-
-        # Apply offset
-        local_time = now_utc + timedelta(hours=offset_hours)
+        local_time = _local_time(widget.timezone_offset, widget.auto_dst)
 
         # Format date string using strftime
         date_str = local_time.strftime(widget.format)
@@ -425,20 +628,14 @@ class Renderer:
         font = get_font(widget.font)
         color = self.resolve_color(widget.color, evaluator)
 
-        # Render each character
-        x_offset = widget.x
-        for char in date_str:
-            pixels = font.render_char(char, color)
-            for px, py, c in pixels:
-                frame.set_pixel(x_offset + px, widget.y + py, c)
-            x_offset += font.width + font.spacing
+        frame.draw_text(widget.x, widget.y, date_str, font, color)
 
     def render_widget(
         self,
         widget: Widget,
         frame: Frame,
         data: dict[str, Any],
-        evaluator: ExpressionEvaluator,
+        evaluator: Optional[ExpressionEvaluator],
     ) -> None:
         """Render a widget to the frame.
 
@@ -446,41 +643,92 @@ class Renderer:
             widget: Widget configuration
             frame: Target frame
             data: Data context
-            evaluator: Expression evaluator
+            evaluator: Expression evaluator, or None if the widget reads no data
         """
-        if isinstance(widget, TextWidget):
-            self.render_text_widget(widget, frame, data, evaluator)
-        elif isinstance(widget, RectWidget):
-            self.render_rect_widget(widget, frame, evaluator)
-        elif isinstance(widget, LineWidget):
-            self.render_line_widget(widget, frame, evaluator)
-        elif isinstance(widget, ImageWidget):
-            self.render_image_widget(widget, frame, data)
-        elif isinstance(widget, ClockWidget):
-            self.render_clock_widget(widget, frame, evaluator)
-        elif isinstance(widget, DateWidget):
-            self.render_date_widget(widget, frame, evaluator)
-        else:
+        handler = self._handlers.get(type(widget))
+        if handler is None:
             logger.warning(f"Unknown widget type: {type(widget)}")
+            return
+        handler(widget, frame, data, evaluator)
+
+    def prepare(self, layout: Layout) -> RenderPlan:
+        """Pre-draw the parts of a layout that never change.
 
-    def render(self, layout: Layout, data: Optional[dict[str, Any]] = None) -> Frame:
+        Static widgets (fixed text, shapes and images with plain colors) are
+        drawn once into a template frame on the background color, as long as
+        nothing drawn before them in the layout could overlap them. Renders
+        copy the template and only draw the remaining widgets. The plan for
+        the most recent layout is cached.
+
+        Args:
+            layout: Layout configuration
+
+        Returns:
+            Tuple of (layout, template frame, widgets to draw per render,
+            whether those need an expression evaluator)
+        """
+        plan = self._plan
+        if plan is not None and plan[0] is layout:
+            return plan
+
+        template = Frame(layout.background)
+        widgets: list[Widget] = []
+        # Boxes of widgets drawn per render; a static widget under one of
+        # them must keep its place in the drawing order
+        deferred: list[tuple[int, int, int, int]] = []
+
+        for widget in layout.widgets:
+            bounds = _widget_bounds(widget)
+            static = _is_static(widget) and not any(_overlaps(bounds, b) for b in deferred)
+            # Keep retrying missing images per render rather than baking a gap
+            if static and isinstance(widget, ImageWidget):
+                static = self.load_image(widget.src, {}) is not None
+            if static:
+                try:
+                    self.render_widget(widget, template, {}, None)
+                    continue
+                except Exception as e:
+                    logger.debug(f"Not pre-drawing widget {widget.id}: {e}")
+            _precompile(widget)
+            widgets.append(widget)
+            deferred.append(bounds)
+
+        logger.debug(
+            f"Prepared layout '{layout.name}': "
+            f"{len(layout.widgets) - len(widgets)} static, {len(widgets)} per-render widgets"
+        )
+        plan = (layout, template, widgets, any(_needs_evaluator(w) for w in widgets))
+        self._plan = plan
+        return plan
+
+    def render(
+        self,
+        layout: Layout,
+        data: Optional[dict[str, Any]] = None,
+        frame: Optional[Frame] = None,
+    ) -> Frame:
         """Render a complete layout to a frame.
 
         Args:
             layout: Layout configuration
             data: Data context for dynamic content
+            frame: Frame to draw into instead of allocating a new one; it is
+                overwritten with the layout's template first
 
         Returns:
             Rendered frame
         """
         data = data or {}
-        evaluator = ExpressionEvaluator(data)
+        _, template, widgets, needs_evaluator = self.prepare(layout)
+        evaluator = ExpressionEvaluator(data) if needs_evaluator else None
 
-        # Create frame with background color
-        frame = Frame(layout.background)
+        # Start from the pre-drawn static content, reusing the caller's buffer if any
+        if frame is None:
+            frame = Frame()
+        frame.copy_from(template)
 
-        # Render each widget
-        for widget in layout.widgets:
+        # Render the remaining widgets
+        for widget in widgets:
             try:
                 self.render_widget(widget, frame, data, evaluator)
             except Exception as e:
@@ -1,10 +1,11 @@
 """Scheduler for periodic data updates and display refresh."""
 
 import asyncio
+import functools
+import inspect
 import logging
-from datetime import datetime
-from pathlib import Path
-from typing import Any, Callable, Optional
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Optional, Union
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -13,6 +14,9 @@ from divoom_client.datasources.manager import DataSourceManager
 
 logger = logging.getLogger(__name__)
 
+# Data update callbacks may be plain functions or coroutine functions
+UpdateCallback = Callable[[dict[str, Any]], Union[None, Awaitable[None]]]
+
 
 class Scheduler:
     """Manages periodic data fetching and display updates."""
@@ -21,7 +25,7 @@ class Scheduler:
         """Initialize the scheduler."""
         self._scheduler = AsyncIOScheduler()
         self._data_manager: Optional[DataSourceManager] = None
-        self._on_data_update: Optional[Callable[[dict[str, Any]], None]] = None
+        self._on_data_update: Optional[UpdateCallback] = None
         self._running = False
 
     @property
@@ -37,48 +41,83 @@ class Scheduler:
         """
         self._data_manager = manager
 
-    def set_update_callback(self, callback: Callable[[dict[str, Any]], None]) -> None:
+    def set_update_callback(self, callback: UpdateCallback) -> None:
         """Set callback to be invoked when data is updated.
 
         Args:
-            callback: Function that receives updated data dict
+            callback: Function that receives updated data dict (can be async)
         """
         self._on_data_update = callback
 
-    def _schedule_data_sources(self) -> None:
-        """Schedule refresh jobs for each data source."""
+    async def _notify(self, data: dict[str, Any]) -> None:
+        """Invoke the update callback, awaiting it if it is async.
+
+        Args:
+            data: Updated data context
+        """
+        if self._on_data_update:
+            result = self._on_data_update(data)
+            if inspect.isawaitable(result):
+                await result
+
+    async def _refresh_sources(self, names: list[str]) -> None:
+        """Refresh a group of data sources concurrently and notify once.
+
+        Args:
+            names: Names of the data sources to refresh
+        """
         if not self._data_manager:
             return
 
-        for name, source in self._data_manager.sources.items():
-            if not source.config.enabled:
-                continue
+        results = await asyncio.gather(
+            # The schedule already paces these; don't let cache age skip a tick
+            *(self._data_manager.refresh(name, force=True) for name in names),
+            return_exceptions=True,
+        )
+
+        refreshed = False
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to refresh {name}: {result}")
+            else:
+                logger.debug(f"Refreshed data source: {name}")
+                refreshed = True
+
+        if refreshed:
+            self._data_manager.save_cache()
 
-            interval = source.config.refresh_seconds
+        # Trigger update callback with all data
+        if refreshed and self._on_data_update:
+            try:
+                await self._notify(self._data_manager.get_data_context())
+            except Exception as e:
+                logger.error(f"Data update callback failed: {e}")
 
-            # Create async job for this source
-            async def refresh_source(source_name: str = name) -> None:
-                try:
-                    await self._data_manager.refresh(source_name)
-                    logger.debug(f"Refreshed data source: {source_name}")
+    def _schedule_data_sources(self) -> None:
+        """Schedule refresh jobs for the data sources.
 
-                    # Trigger update callback with all data
-                    if self._on_data_update:
-                        data = self._data_manager.get_data_context()
-                        self._on_data_update(data)
+        Sources sharing a refresh interval are grouped into one job that
+        refreshes them concurrently and notifies once, instead of one timer
+        wakeup and one render per source.
+        """
+        if not self._data_manager:
+            return
 
-                except Exception as e:
-                    logger.error(f"Failed to refresh {source_name}: {e}")
+        buckets: dict[int, list[str]] = defaultdict(list)
+        for name, source in self._data_manager.sources.items():
+            if source.config.enabled:
+                buckets[source.config.refresh_seconds].append(name)
 
+        for interval, names in buckets.items():
             self._scheduler.add_job(
-                refresh_source,
+                functools.partial(self._refresh_sources, names),
                 trigger=IntervalTrigger(seconds=interval),
-                id=f"datasource_{name}",
-                name=f"Refresh {name}",
+                id=f"datasources_{interval}s",
+                name=f"Refresh {', '.join(names)}",
                 replace_existing=True,
             )
 
-            logger.info(f"Scheduled '{name}' to refresh every {interval}s")
+            logger.info(f"Scheduled {', '.join(names)} to refresh every {interval}s")
 
     def add_job(
         self,
@@ -135,8 +174,7 @@ class Scheduler:
             logger.info("Performing initial data fetch...")
             try:
                 data = await self._data_manager.refresh_all()
-                if self._on_data_update:
-                    self._on_data_update(data)
+                await self._notify(data)
             except Exception as e:
                 logger.error(f"Initial data fetch failed: {e}")
 
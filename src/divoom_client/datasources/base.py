@@ -1,11 +1,12 @@
 """Base data source interface."""
 
 import logging
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +14,9 @@ logger = logging.getLogger(__name__)
 class DataSourceConfig(BaseModel):
     """Base configuration for data sources."""
 
+    # Shared by sources and read on every refresh; replace, don't mutate
+    model_config = ConfigDict(frozen=True)
+
     type: str = Field(description="Data source type identifier")
     refresh_seconds: int = Field(default=300, ge=1, description="Refresh interval in seconds")
     enabled: bool = Field(default=True, description="Whether this source is enabled")
@@ -31,6 +35,7 @@ class DataSource(ABC):
         self.name = name
         self.config = config
         self._last_fetch: Optional[datetime] = None
+        self._last_fetch_ts: Optional[float] = None
         self._cached_data: Optional[dict[str, Any]] = None
         self._error: Optional[str] = None
 
@@ -54,6 +59,13 @@ class DataSource(ABC):
         """Return the last error message, if any."""
         return self._error
 
+    @property
+    def is_fresh(self) -> bool:
+        """Return True if the cached data is younger than refresh_seconds."""
+        if self._last_fetch_ts is None:
+            return False
+        return time.monotonic() - self._last_fetch_ts < self.config.refresh_seconds
+
     @abstractmethod
     async def fetch(self) -> dict[str, Any]:
         """Fetch data from the source.
@@ -66,16 +78,28 @@ class DataSource(ABC):
         """
         pass
 
-    async def refresh(self) -> dict[str, Any]:
+    async def refresh(self, force: bool = False) -> dict[str, Any]:
         """Refresh data from the source, updating cache.
 
+        Data fetched less than refresh_seconds ago is returned from the cache
+        without touching the network unless force is set.
+
+        Args:
+            force: Fetch even if the cached data is still fresh
+
         Returns:
             Dictionary of fetched data
         """
+        if not force and self.is_fresh and self._cached_data is not None:
+            logger.debug(f"Data source '{self.name}' is fresh, using cached data")
+            return self._cached_data
+
+        started = time.monotonic()
         try:
             data = await self.fetch()
             self._cached_data = data
             self._last_fetch = datetime.now()
+            self._last_fetch_ts = started
             self._error = None
             logger.info(f"Data source '{self.name}' refreshed successfully")
             return data
@@ -84,6 +108,21 @@ class DataSource(ABC):
             logger.error(f"Data source '{self.name}' fetch failed: {e}")
             raise
 
+    def restore(self, data: dict[str, Any]) -> None:
+        """Seed the cache with data persisted by a previous run.
+
+        Restored data is served by get_data() but never counts as fresh, so
+        the next refresh still fetches.
+
+        Args:
+            data: Previously fetched data
+        """
+        if self._cached_data is None:
+            self._cached_data = data
+
+    def close(self) -> None:
+        """Release network resources held by the source (no-op by default)."""
+
     def get_data(self) -> dict[str, Any]:
         """Get current data (cached or empty).
 
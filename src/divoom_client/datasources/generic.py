@@ -1,6 +1,7 @@
 """Generic REST API data fetcher."""
 
 import asyncio
+import functools
 import logging
 import os
 import re
@@ -12,8 +13,50 @@ from pydantic import Field
 
 from divoom_client.datasources.base import DataSource, DataSourceConfig
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# ${ENV_VAR} references in header and parameter values
+_ENV_RE = re.compile(r"\$\{([^}]+)\}")
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """Decode a JSON response body.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        Decoded JSON value
+
+    Raises:
+        ValueError: If the body is not JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # Not UTF-8 or uses NaN/huge ints; let requests sniff and decode
+            pass
+    return response.json()
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_jsonpath(path: str) -> Any:
+    """Parse a JSONPath expression once; parsing costs far more than matching.
+
+    Args:
+        path: JSONPath expression
+
+    Returns:
+        Compiled jsonpath_ng expression
+    """
+    return jsonpath_parse(path)
+
 
 class GenericDataSourceConfig(DataSourceConfig):
     """Configuration for generic REST API data source."""
@@ -54,25 +97,39 @@ class GenericDataSource(DataSource):
         self.body = config.body
         self.json_path = config.json_path
         self.json_paths = config.json_paths
+        # Warm the parse cache so refreshes only evaluate the expressions
+        for path in ([self.json_path] if self.json_path else []) + list(self.json_paths.values()):
+            try:
+                _compile_jsonpath(path)
+            except Exception:
+                pass  # Reported on each fetch by _extract_jsonpath
         self.timeout = config.timeout
+        # Keep-alive session so refreshes reuse the connection to the API
+        self._session = requests.Session()
+
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self._session.close()
 
     def _resolve_env_vars(self, data: dict[str, str]) -> dict[str, str]:
         """Resolve environment variable references in dictionary values.
 
+        References may be embedded (e.g. "Bearer ${API_TOKEN}"); unset
+        variables resolve to an empty string.
+
         Args:
             data: Dictionary with potential ${ENV_VAR} references
 
         Returns:
             Dictionary with resolved values
         """
-        result = {}
-        for key, value in data.items():
-            if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-                env_var = value[2:-1]
-                result[key] = os.environ.get(env_var, "")
-            else:
-                result[key] = value
-        return result
+        def lookup(match: re.Match[str]) -> str:
+            return os.environ.get(match.group(1), "")
+
+        return {
+            key: _ENV_RE.sub(lookup, value) if isinstance(value, str) and "${" in value else value
+            for key, value in data.items()
+        }
 
     def _extract_jsonpath(self, data: Any, path: str) -> Any:
         """Extract value using JSONPath expression.
@@ -85,7 +142,7 @@ class GenericDataSource(DataSource):
             Extracted value or None
         """
         try:
-            expr = jsonpath_parse(path)
+            expr = _compile_jsonpath(path)
             matches = expr.find(data)
             if matches:
                 if len(matches) == 1:
@@ -99,12 +156,13 @@ class GenericDataSource(DataSource):
     async def fetch(self) -> dict[str, Any]:
         """Fetch data from the configured API.
 
+        The request runs in a worker thread on the source's keep-alive
+        session; DataSourceManager.refresh_all gathers sources concurrently.
+
         Returns:
             Dictionary with fetched/extracted data
         """
-        loop = asyncio.get_event_loop()
-        data = await loop.run_in_executor(None, self._fetch_sync)
-        return data
+        return await asyncio.to_thread(self._fetch_sync)
 
     def _fetch_sync(self) -> dict[str, Any]:
         """Synchronous fetch implementation."""
@@ -118,12 +176,12 @@ class GenericDataSource(DataSource):
             if self.method in ("POST", "PUT", "PATCH") and self.body:
                 kwargs["json"] = self.body
 
-            response = requests.request(self.method, self.url, **kwargs)
+            response = self._session.request(self.method, self.url, **kwargs)
             response.raise_for_status()
 
             # Parse JSON response
             try:
-                data = response.json()
+                data = _decode_json(response)
             except ValueError:
                 # Non-JSON response
                 return {"raw": response.text}
@@ -11,8 +11,16 @@ from divoom_client.datasources.generic import create_generic_source
 from divoom_client.datasources.stocks import create_stock_source
 from divoom_client.datasources.weather import create_weather_source
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on a single refresh so one hung upstream can't stall the others
+REFRESH_TIMEOUT_SECONDS = 30
+
 # Registry of data source factories
 SOURCE_FACTORIES = {
     "stocks": create_stock_source,
@@ -21,13 +29,46 @@ SOURCE_FACTORIES = {
 }
 
 
+def _build_source(name: str, config: dict[str, Any]) -> DataSource:
+    """Create a data source from configuration without registering it.
+
+    Args:
+        name: Name for the data source
+        config: Configuration dictionary with 'type' key
+
+    Returns:
+        Created DataSource instance
+
+    Raises:
+        ValueError: If source type is unknown or the config is invalid
+    """
+    source_type = config.get("type")
+    factory = SOURCE_FACTORIES.get(source_type) if isinstance(source_type, str) else None
+    if factory is None:
+        raise ValueError(
+            f"Unknown data source type: {source_type}. "
+            f"Available types: {list(SOURCE_FACTORIES.keys())}"
+        )
+    return factory(name, config)
+
+
 class DataSourceManager:
     """Manages multiple data sources and provides unified data context."""
 
-    def __init__(self):
-        """Initialize the data source manager."""
+    def __init__(self, cache_path: Optional[Path] = None):
+        """Initialize the data source manager.
+
+        Args:
+            cache_path: File where the last fetched data is kept across
+                restarts, so widgets show last-known values until the first
+                refresh completes (None to disable)
+        """
         self._sources: dict[str, DataSource] = {}
         self._data_context: dict[str, Any] = {}
+        self._enabled_names: set[str] = set()
+        self._cache_path = cache_path
+        self._cache_dirty = False
+        self._restored = self._read_cache()
 
     @property
     def sources(self) -> dict[str, DataSource]:
@@ -47,6 +88,14 @@ class DataSourceManager:
             source: DataSource instance
         """
         self._sources[name] = source
+        restored = self._restored.pop(name, None)
+        if restored:
+            source.restore(restored)
+            self._data_context.setdefault(name, restored)
+        if source.config.enabled:
+            self._enabled_names.add(name)
+        else:
+            self._enabled_names.discard(name)
         logger.info(f"Registered data source: {name} ({source.source_type})")
 
     def unregister(self, name: str) -> None:
@@ -55,12 +104,32 @@ class DataSourceManager:
         Args:
             name: Name of source to remove
         """
-        if name in self._sources:
-            del self._sources[name]
-            if name in self._data_context:
-                del self._data_context[name]
+        if self._sources.pop(name, None) is not None:
+            self._enabled_names.discard(name)
+            if self._data_context.pop(name, None) is not None:
+                self._cache_dirty = True
             logger.info(f"Unregistered data source: {name}")
 
+    def set_enabled(self, name: str, enabled: bool) -> None:
+        """Enable or disable a registered data source at runtime.
+
+        Args:
+            name: Name of the data source
+            enabled: Whether refresh_all should refresh the source
+
+        Raises:
+            KeyError: If source not found
+        """
+        source = self._sources.get(name)
+        if source is None:
+            raise KeyError(f"Data source not found: {name}")
+
+        source.config = source.config.model_copy(update={"enabled": enabled})
+        if enabled:
+            self._enabled_names.add(name)
+        else:
+            self._enabled_names.discard(name)
+
     def create_source(self, name: str, config: dict[str, Any]) -> DataSource:
         """Create and register a data source from configuration.
 
@@ -74,15 +143,7 @@ class DataSourceManager:
         Raises:
             ValueError: If source type is unknown
         """
-        source_type = config.get("type")
-        if source_type not in SOURCE_FACTORIES:
-            raise ValueError(
-                f"Unknown data source type: {source_type}. "
-                f"Available types: {list(SOURCE_FACTORIES.keys())}"
-            )
-
-        factory = SOURCE_FACTORIES[source_type]
-        source = factory(name, config)
+        source = _build_source(name, config)
         self.register(name, source)
         return source
 
@@ -97,13 +158,19 @@ class DataSourceManager:
             return
 
         try:
-            with open(config_path) as f:
-                config = json.load(f)
-
-            sources = config.get("sources", {})
-            for name, source_config in sources.items():
-                if source_config.get("enabled", True):
-                    self.create_source(name, source_config)
+            raw = config_path.read_bytes()
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            config = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+            # Build every source before registering any, so a bad entry
+            # leaves the manager unchanged
+            sources = [
+                _build_source(name, source_config)
+                for name, source_config in config.get("sources", {}).items()
+                if source_config.get("enabled", True)
+            ]
+            for source in sources:
+                self.register(source.name, source)
 
             logger.info(f"Loaded {len(self._sources)} data sources from {config_path}")
 
@@ -111,56 +178,115 @@ class DataSourceManager:
             logger.error(f"Failed to load data sources config: {e}")
             raise
 
-    async def refresh(self, name: str) -> dict[str, Any]:
+    def close(self) -> None:
+        """Release network resources held by all data sources."""
+        for source in self._sources.values():
+            source.close()
+
+    async def refresh(self, name: str, force: bool = False) -> dict[str, Any]:
         """Refresh a specific data source.
 
         Args:
             name: Name of the data source
+            force: Fetch even if the source's cached data is still fresh
 
         Returns:
             Updated data from the source
 
         Raises:
             KeyError: If source not found
+            TimeoutError: If the source takes longer than its refresh
+                interval or REFRESH_TIMEOUT_SECONDS
         """
-        if name not in self._sources:
+        source = self._sources.get(name)
+        if source is None:
             raise KeyError(f"Data source not found: {name}")
 
-        source = self._sources[name]
-        data = await source.refresh()
+        timeout = min(source.config.refresh_seconds, REFRESH_TIMEOUT_SECONDS)
+        try:
+            data = await asyncio.wait_for(source.refresh(force=force), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Data source '{name}' timed out after {timeout}s") from None
         self._data_context[name] = data
+        self._cache_dirty = True
         return data
 
-    async def refresh_all(self) -> dict[str, Any]:
+    async def refresh_all(self, force: bool = False) -> dict[str, Any]:
         """Refresh all data sources concurrently.
 
+        Sources whose cached data is still fresh are skipped unless force
+        is set.
+
+        Args:
+            force: Fetch every source regardless of cache age
+
         Returns:
             Complete data context
         """
         if not self._sources:
             return {}
 
-        # Create refresh tasks for all sources
-        tasks = []
-        names = []
-        for name, source in self._sources.items():
-            if source.config.enabled:
-                tasks.append(source.refresh())
-                names.append(name)
+        sources = self._sources
+        names = [
+            name for name in self._enabled_names
+            if force or not sources[name].is_fresh
+        ]
 
-        # Execute all refreshes concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Each refresh stores its result as soon as it completes, so a slow
+        # source only delays itself
+        results = await asyncio.gather(
+            *(self.refresh(name, force=force) for name in names),
+            return_exceptions=True,
+        )
 
-        # Update data context
         for name, result in zip(names, results):
             if isinstance(result, Exception):
                 logger.error(f"Failed to refresh {name}: {result}")
                 # Keep old data if available
-            else:
-                self._data_context[name] = result
 
+        self.save_cache()
         return self._data_context
 
+    def _read_cache(self) -> dict[str, Any]:
+        """Read data persisted by a previous run.
+
+        Returns:
+            Cached data keyed by source name, empty if unavailable
+        """
+        if self._cache_path is None or not self._cache_path.exists():
+            return {}
+
+        try:
+            raw = self._cache_path.read_bytes()
+            cached = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable data cache {self._cache_path}: {e}")
+            return {}
+
+        if not isinstance(cached, dict):
+            return {}
+        logger.debug(f"Restored cached data for {len(cached)} sources")
+        return cached
+
+    def save_cache(self) -> None:
+        """Persist the data context if it changed since the last save."""
+        if self._cache_path is None or not self._cache_dirty:
+            return
+
+        if orjson is not None:
+            raw = orjson.dumps(self._data_context, default=str)
+        else:
+            raw = json.dumps(self._data_context, default=str).encode()
+
+        # Write then rename so a crash never leaves a truncated cache
+        tmp_path = self._cache_path.with_name(self._cache_path.name + ".tmp")
+        try:
+            tmp_path.write_bytes(raw)
+            tmp_path.replace(self._cache_path)
+            self._cache_dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to write data cache {self._cache_path}: {e}")
+
     def get_data_context(self) -> dict[str, Any]:
         """Get the current data context for rendering.
 
@@ -190,6 +316,7 @@ class DataSourceManager:
         """Clear all data sources."""
         self._sources.clear()
         self._data_context.clear()
+        self._enabled_names.clear()
 
     def __repr__(self) -> str:
         return f"DataSourceManager(sources={list(self._sources.keys())})"
@@ -2,7 +2,8 @@
 
 import asyncio
 import logging
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
 
 import yfinance as yf
 from pydantic import Field
@@ -11,6 +12,9 @@ from divoom_client.datasources.base import DataSource, DataSourceConfig
 
 logger = logging.getLogger(__name__)
 
+# Per-symbol fallback lookups run in parallel; they are network-bound
+_EXECUTOR = ThreadPoolExecutor(max_workers=10, thread_name_prefix="yfinance")
+
 
 class StockDataSourceConfig(DataSourceConfig):
     """Configuration for stock data source."""
@@ -42,71 +46,145 @@ class StockDataSource(DataSource):
         if not self.symbols:
             return {}
 
-        # yfinance is synchronous, run in executor
-        loop = asyncio.get_event_loop()
-        data = await loop.run_in_executor(None, self._fetch_sync)
-        return data
+        # yfinance is synchronous, run in a worker thread
+        return await asyncio.to_thread(self._fetch_sync)
 
     def _fetch_sync(self) -> dict[str, Any]:
-        """Synchronous fetch implementation."""
+        """Synchronous fetch implementation.
+
+        All symbols are downloaded in one batched yf.download call; symbols
+        missing from the batch fall back to per-symbol lookups, run
+        concurrently.
+        """
+        closes = self._download_closes()
+
+        missing = [symbol for symbol in self.symbols if symbol not in closes]
+        fallback = dict(zip(missing, _EXECUTOR.map(self._fetch_one, missing)))
+
         result: dict[str, Any] = {}
+        for symbol in self.symbols:
+            close = closes.get(symbol)
+            if close:
+                result[symbol] = _quote(symbol, close[-1], close[-2] if len(close) > 1 else None)
+            else:
+                result[symbol] = fallback[symbol]
+        return result
+
+    def _download_closes(self) -> dict[str, list[float]]:
+        """Download recent daily closes for all symbols in one request.
+
+        Returns:
+            Closing prices (oldest first) keyed by symbol; symbols without
+            data are omitted
+        """
+        try:
+            df = yf.download(
+                self.symbols,
+                period="2d",
+                group_by="ticker",
+                auto_adjust=False,
+                threads=True,
+                progress=False,
+            )
+        except Exception as e:
+            logger.warning(f"Batched stock download failed: {e}")
+            return {}
+
+        closes: dict[str, list[float]] = {}
+        if df is None or df.empty:
+            return closes
 
         for symbol in self.symbols:
             try:
-                ticker = yf.Ticker(symbol)
-
-                # Get current price info
-                info = ticker.fast_info
-
-                current_price = getattr(info, 'last_price', None)
-                previous_close = getattr(info, 'previous_close', None)
-
-                if current_price is None:
-                    # Fallback to history
-                    hist = ticker.history(period="2d")
-                    if not hist.empty:
-                        current_price = float(hist['Close'].iloc[-1])
-                        if len(hist) > 1:
-                            previous_close = float(hist['Close'].iloc[-2])
-
-                if current_price is not None:
-                    change = 0.0
-                    change_percent = 0.0
-
-                    if previous_close and previous_close > 0:
-                        change = current_price - previous_close
-                        change_percent = (change / previous_close) * 100
-
-                    result[symbol] = {
-                        "price": round(current_price, 2),
-                        "previous_close": round(previous_close, 2) if previous_close else None,
-                        "change": round(change, 2),
-                        "change_percent": round(change_percent, 2),
-                        "symbol": symbol,
-                    }
-                    logger.debug(f"Fetched {symbol}: ${current_price:.2f} ({change:+.2f})")
-                else:
-                    logger.warning(f"Could not get price for {symbol}")
-                    result[symbol] = {
-                        "price": None,
-                        "change": None,
-                        "change_percent": None,
-                        "symbol": symbol,
-                        "error": "No price data available",
-                    }
-
-            except Exception as e:
-                logger.error(f"Error fetching {symbol}: {e}")
-                result[symbol] = {
-                    "price": None,
-                    "change": None,
-                    "change_percent": None,
-                    "symbol": symbol,
-                    "error": str(e),
-                }
+                close = df[symbol]["Close"].dropna()
+            except KeyError:
+                continue
+            if not close.empty:
+                closes[symbol] = [float(price) for price in close]
+        return closes
 
-        return result
+    def _fetch_one(self, symbol: str) -> dict[str, Any]:
+        """Fetch a single symbol's quote.
+
+        Args:
+            symbol: Ticker symbol
+
+        Returns:
+            Quote dictionary for the symbol
+        """
+        try:
+            ticker = yf.Ticker(symbol)
+
+            # Get current price info
+            info = ticker.fast_info
 
+            current_price = getattr(info, 'last_price', None)
+            previous_close = getattr(info, 'previous_close', None)
+
+            if current_price is None:
+                # Fallback to history
+                hist = ticker.history(period="2d")
+                if not hist.empty:
+                    current_price = float(hist['Close'].iloc[-1])
+                    if len(hist) > 1:
+                        previous_close = float(hist['Close'].iloc[-2])
+
+            if current_price is not None:
+                return _quote(symbol, current_price, previous_close)
+
+            logger.warning(f"Could not get price for {symbol}")
+            return _error_quote(symbol, "No price data available")
+
+        except Exception as e:
+            logger.error(f"Error fetching {symbol}: {e}")
+            return _error_quote(symbol, str(e))
+
+
+def _quote(symbol: str, current_price: float, previous_close: Optional[float]) -> dict[str, Any]:
+    """Build the quote dictionary for a symbol.
+
+    Args:
+        symbol: Ticker symbol
+        current_price: Latest price
+        previous_close: Previous session's close, if known
+
+    Returns:
+        Quote dictionary
+    """
+    change = 0.0
+    change_percent = 0.0
+
+    if previous_close and previous_close > 0:
+        change = current_price - previous_close
+        change_percent = (change / previous_close) * 100
+
+    logger.debug(f"Fetched {symbol}: ${current_price:.2f} ({change:+.2f})")
+    return {
+        "price": round(current_price, 2),
+        "previous_close": round(previous_close, 2) if previous_close else None,
+        "change": round(change, 2),
+        "change_percent": round(change_percent, 2),
+        "symbol": symbol,
+    }
+
+
+def _error_quote(symbol: str, error: str) -> dict[str, Any]:
+    """Build the placeholder quote for a symbol that could not be fetched.
+
+    Args:
+        symbol: Ticker symbol
+        error: Error message
+
+    Returns:
+        Quote dictionary with no price
+    """
+    return {
+        "price": None,
+        "change": None,
+        "change_percent": None,
+        "symbol": symbol,
+        "error": error,
+    }
 
 def create_stock_source(name: str, config_dict: dict[str, Any]) -> StockDataSource:
     """Factory function to create a stock data source.
@@ -7,14 +7,42 @@ from typing import Any, Optional
 
 import requests
 from pydantic import Field
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from divoom_client import __version__
 from divoom_client.datasources.base import DataSource, DataSourceConfig
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 OPENWEATHER_API_URL = "https://api.openweathermap.org/data/2.5/weather"
 
 
+def _create_session() -> requests.Session:
+    """Build the pooled session shared by all weather sources.
+
+    Every source talks to the same API host, so they share keep-alive
+    connections; rate limits and transient server errors are retried with
+    backoff.
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry))
+    session.headers["User-Agent"] = f"divoom-client/{__version__}"
+    return session
+
+
+_SESSION = _create_session()
+
+
 class WeatherDataSourceConfig(DataSourceConfig):
     """Configuration for weather data source."""
 
@@ -69,9 +97,7 @@ class WeatherDataSource(DataSource):
         if not self.api_key:
             raise ValueError("OpenWeatherMap API key not configured")
 
-        loop = asyncio.get_event_loop()
-        data = await loop.run_in_executor(None, self._fetch_sync)
-        return data
+        return await asyncio.to_thread(self._fetch_sync)
 
     def _fetch_sync(self) -> dict[str, Any]:
         """Synchronous fetch implementation."""
@@ -82,9 +108,9 @@ class WeatherDataSource(DataSource):
         }
 
         try:
-            response = requests.get(OPENWEATHER_API_URL, params=params, timeout=10)
+            response = _SESSION.get(OPENWEATHER_API_URL, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content) if orjson is not None else response.json()
 
             # Extract relevant fields
             main = data.get("main", {})
@@ -113,7 +139,8 @@ class WeatherDataSource(DataSource):
             )
             return result
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # ValueError covers a non-JSON body (orjson.JSONDecodeError)
             logger.error(f"Weather fetch failed: {e}")
             raise
 
@@ -3,13 +3,16 @@
 from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class DeviceConfig(BaseModel):
     """Pixoo device configuration."""
 
+    # Instances are shared through the device.json cache in discovery
+    model_config = ConfigDict(frozen=True)
+
     ip_address: Optional[str] = Field(default=None, description="Manual IP address of Pixoo device")
     brightness: int = Field(default=100, ge=0, le=100, description="Display brightness (0-100)")
     device_id: Optional[int] = Field(default=None, description="Device ID for multi-device setups")
@@ -1,8 +1,9 @@
 """Layout and widget models."""
 
-from typing import Any, Literal, Optional, Union
+from functools import cached_property
+from typing import Annotated, Any, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Discriminator, Field, Tag
 
 
 class ColorCondition(BaseModel):
@@ -99,7 +100,28 @@ class DateWidget(BaseModel):
     color: Union[str, ConditionalColor] = Field(default="#FFFFFF")
 
 
-Widget = Union[TextWidget, RectWidget, LineWidget, ImageWidget, ClockWidget, DateWidget]
+def _widget_type(value: Any) -> Optional[str]:
+    """Pick the Widget variant from the type tag; untagged widgets are text."""
+    tag: Optional[str]
+    if isinstance(value, dict):
+        tag = value.get("type", "text")
+    else:
+        tag = getattr(value, "type", None)
+    return tag
+
+
+# Validation dispatches on the type tag instead of trying every variant
+Widget = Annotated[
+    Union[
+        Annotated[TextWidget, Tag("text")],
+        Annotated[RectWidget, Tag("rect")],
+        Annotated[LineWidget, Tag("line")],
+        Annotated[ImageWidget, Tag("image")],
+        Annotated[ClockWidget, Tag("clock")],
+        Annotated[DateWidget, Tag("date")],
+    ],
+    Discriminator(_widget_type),
+]
 
 
 class Layout(BaseModel):
@@ -110,9 +132,24 @@ class Layout(BaseModel):
     refresh_seconds: int = Field(default=60, ge=1, description="How often to refresh the display")
     widgets: list[Widget] = Field(default_factory=list)
 
-    def get_widget(self, widget_id: str) -> Optional[Widget]:
-        """Get a widget by ID."""
+    @cached_property
+    def _widget_index(self) -> tuple[list[Widget], int, dict[str, Widget]]:
+        """Index widgets by id, keeping the list it was built from."""
+        by_id: dict[str, Widget] = {}
         for widget in self.widgets:
-            if widget.id == widget_id:
-                return widget
-        return None
+            if widget.id is not None:
+                # First widget wins on duplicate ids
+                by_id.setdefault(widget.id, widget)
+        return self.widgets, len(self.widgets), by_id
+
+    def get_widget(self, widget_id: str) -> Optional[Widget]:
+        """Get a widget by ID.
+
+        The id index is built on first use and rebuilt if the widgets list is
+        replaced or resized.
+        """
+        index = self._widget_index
+        if index[0] is not self.widgets or index[1] != len(self.widgets):
+            del self.__dict__["_widget_index"]
+            index = self._widget_index
+        return index[2].get(widget_id)
@@ -2,21 +2,47 @@
 
 import asyncio
 import base64
+import functools
+import hashlib
 import io
 import json
 import logging
 import tempfile
+import threading
 import uuid
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
-from fastapi import FastAPI, HTTPException, Request, UploadFile, File
+from fastapi import FastAPI, HTTPException, Query, Request, UploadFile, File
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse, JSONResponse, Response
 from pydantic import BaseModel
-from PIL import Image
+from PIL import Image, features
+
+from divoom_client.core.frame import PIXOO_SIZE
+from divoom_client.core.renderer import Renderer
 
 logger = logging.getLogger(__name__)
 
+# Largest upscale factor /api/preview will render
+MAX_PREVIEW_SCALE = 8
+
+# Responses smaller than this are sent uncompressed
+GZIP_MINIMUM_SIZE = 1024
+
+# Layout saves from the editor are coalesced and written at most this often
+LAYOUT_FLUSH_SECONDS = 5.0
+
+# Pillow builds without libwebp fall back to PNG previews
+WEBP_SUPPORTED = features.check("webp")
+
+# Both favour encode speed over size; previews are served over the LAN
+_PREVIEW_ENCODER_OPTIONS: dict[str, dict[str, Any]] = {
+    "PNG": {"compress_level": 1},
+    "WEBP": {"lossless": True, "quality": 0, "method": 0},
+}
+
 
 # --- Request Models ---
 
@@ -65,6 +91,128 @@ class NewLayoutRequest(BaseModel):
     name: str
 
 
+# --- File helpers (run in a worker thread from async routes) ---
+
+def _read_json(path: Path) -> Any:
+    """Read a JSON file.
+
+    Args:
+        path: File to read
+
+    Returns:
+        Decoded JSON value
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any, atomic: bool = False) -> None:
+    """Write data as indented JSON.
+
+    Args:
+        path: File to write
+        data: JSON-serializable value
+        atomic: Write to a temp file and rename it into place
+    """
+    target = path.with_suffix(".tmp") if atomic else path
+    with open(target, "w") as f:
+        json.dump(data, f, indent=2)
+    if atomic:
+        target.rename(path)
+
+
+@functools.lru_cache(maxsize=4)
+def _layout_names_cached(dir_str: str, mtime_ns: int) -> tuple[str, ...]:
+    """Scan a layouts directory, cached per (path, directory mtime)."""
+    return tuple(sorted(p.stem for p in Path(dir_str).glob("*.json")))
+
+
+def _list_layout_names(layouts_dir: Path) -> list[str]:
+    """List layout names (file stems) in a directory, sorted.
+
+    Creating, deleting or renaming a file bumps the directory's mtime, so
+    the glob only reruns when the set of layouts may have changed.
+    """
+    try:
+        mtime_ns = layouts_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+    return list(_layout_names_cached(str(layouts_dir), mtime_ns))
+
+
+@functools.lru_cache(maxsize=1)
+def _index_html_bytes() -> bytes:
+    """Return the UTF-8 encoded web UI page, encoded once."""
+    return get_index_html().encode("utf-8")
+
+
+@functools.lru_cache(maxsize=1)
+def _index_etag() -> str:
+    """Return the strong ETag of the web UI page."""
+    return f'"{hashlib.sha1(_index_html_bytes()).hexdigest()}"'
+
+
+@functools.lru_cache(maxsize=8)
+def _preview_image(rgb: bytes, scale: int = 1, image_format: str = "PNG") -> bytes:
+    """Encode a frame as an image file.
+
+    The UI polls the preview while the frame rarely changes, so encodings
+    are memoized by frame content. Browsers upscale the native 64x64 image
+    themselves (image-rendering: pixelated).
+
+    Args:
+        rgb: Packed RGB frame bytes (Frame.to_bytes())
+        scale: Nearest-neighbor upscale factor
+        image_format: "PNG" or "WEBP"
+
+    Returns:
+        Encoded file contents
+    """
+    img = Image.frombytes("RGB", (PIXOO_SIZE, PIXOO_SIZE), rgb)
+    if scale > 1:
+        img = img.resize((PIXOO_SIZE * scale, PIXOO_SIZE * scale), resample=Image.Resampling.NEAREST)
+    buffer = io.BytesIO()
+    img.save(buffer, format=image_format, **_PREVIEW_ENCODER_OPTIONS[image_format])
+    return buffer.getvalue()
+
+
+@functools.lru_cache(maxsize=8)
+def _preview_etag(rgb: bytes, scale: int = 1, image_format: str = "PNG") -> str:
+    """Return a strong ETag for a preview image, memoized by frame content.
+
+    Args:
+        rgb: Packed RGB frame bytes (Frame.to_bytes())
+        scale: Nearest-neighbor upscale factor
+        image_format: "PNG" or "WEBP"
+
+    Returns:
+        Quoted ETag value
+    """
+    return f'"{hashlib.sha1(_preview_image(rgb, scale, image_format)).hexdigest()}"'
+
+
+@functools.lru_cache(maxsize=4)
+def _preview_data_uri(rgb: bytes) -> str:
+    """Encode a frame as a base64 data URI, memoized by frame content.
+
+    Uses lossless WebP when Pillow supports it, which is about half the size
+    of the PNG at 64x64. The URI carries its own media type, so the UI does
+    not need to know which one it got.
+
+    Args:
+        rgb: Packed RGB frame bytes (Frame.to_bytes())
+
+    Returns:
+        data:image/webp (or image/png) base64 URI
+    """
+    image_format = "WEBP" if WEBP_SUPPORTED else "PNG"
+    b64 = base64.b64encode(_preview_image(rgb, 1, image_format)).decode("ascii")
+    return f"data:image/{image_format.lower()};base64,{b64}"
+
+
 def create_app(display_manager: Any) -> FastAPI:
     """Create the FastAPI application.
 
@@ -74,11 +222,72 @@ def create_app(display_manager: Any) -> FastAPI:
     Returns:
         Configured FastAPI app
     """
+    # Layouts saved by the editor but not yet written, by file path. Every
+    # route that reads layout files consults or flushes this first; entries
+    # stay here until their write has completed.
+    pending_layouts: dict[Path, dict[str, Any]] = {}
+    layout_write_lock = asyncio.Lock()
+    flush_timer: Optional[asyncio.TimerHandle] = None
+    # The loop only holds weak references to tasks, so keep timer flushes alive
+    flush_tasks: set[asyncio.Task[None]] = set()
+
+    # Editor previews render unsaved layouts; a renderer of their own keeps
+    # them from racing the display worker or replacing the live layout's plan
+    preview_renderer = Renderer(display_manager._renderer.assets_dir)
+    preview_lock = threading.Lock()
+
+    def render_layout_preview(layout: Any) -> bytes:
+        """Render a layout on the preview renderer and snapshot its pixels."""
+        with preview_lock:
+            frame = preview_renderer.render(layout, display_manager._last_data or {})
+            return frame.to_bytes()
+
+    async def flush_layouts(path: Optional[Path] = None) -> None:
+        """Write pending layout saves to disk.
+
+        Args:
+            path: Only flush this layout (None flushes all)
+        """
+        # Also waits out any flush already writing, so readers see its result
+        async with layout_write_lock:
+            if path is None:
+                batch = list(pending_layouts.items())
+            else:
+                data = pending_layouts.get(path)
+                batch = [] if data is None else [(path, data)]
+
+            for layout_path, data in batch:
+                try:
+                    await asyncio.to_thread(_write_json, layout_path, data, atomic=True)
+                except OSError as e:
+                    logger.error(f"Failed to save layout {layout_path}: {e}")
+                # Keep a newer save that arrived during the write
+                if pending_layouts.get(layout_path) is data:
+                    del pending_layouts[layout_path]
+
+    def on_flush_timer() -> None:
+        nonlocal flush_timer
+        flush_timer = None
+        task = asyncio.ensure_future(flush_layouts())
+        flush_tasks.add(task)
+        task.add_done_callback(flush_tasks.discard)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        yield
+        if flush_timer is not None:
+            flush_timer.cancel()
+        await asyncio.gather(*flush_tasks)
+        await flush_layouts()
+
     app = FastAPI(
         title="Divoom Client",
         description="Web interface for Divoom Pixoo 64 display manager",
         version="0.1.0",
+        lifespan=lifespan,
     )
+    # JSON and the UI page compress well; level 1 keeps the CPU cost negligible
+    app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=1)
 
     app.state.display_manager = display_manager
 
@@ -99,12 +308,12 @@ def create_app(display_manager: Any) -> FastAPI:
         """Refresh data from sources."""
         try:
             if request.source:
-                data = await display_manager._data_manager.refresh(request.source)
+                data = await display_manager._data_manager.refresh(request.source, force=True)
                 return {"success": True, "source": request.source, "data": data}
             else:
-                data = await display_manager._data_manager.refresh_all()
+                data = await display_manager._data_manager.refresh_all(force=True)
                 display_manager._last_data = data
-                display_manager._render_and_send()
+                await asyncio.to_thread(display_manager._render_and_send)
                 return {"success": True, "data": data}
         except Exception as e:
             logger.error(f"Refresh failed: {e}")
@@ -131,49 +340,59 @@ def create_app(display_manager: Any) -> FastAPI:
     @app.get("/api/layouts")
     async def list_layouts() -> list[str]:
         """List available layouts."""
-        layouts_dir = display_manager.config_dir / "layouts"
-        if not layouts_dir.exists():
-            return []
-        return sorted([p.stem for p in layouts_dir.glob("*.json")])
+        names = await asyncio.to_thread(_list_layout_names, display_manager.config_dir / "layouts")
+        return sorted(set(names).union(p.stem for p in pending_layouts))
 
     @app.get("/api/layouts/{name}")
     async def get_layout_by_name(name: str) -> dict[str, Any]:
         """Get a specific layout by name."""
         layout_path = display_manager.config_dir / "layouts" / f"{name}.json"
-        if not layout_path.exists():
+        pending = pending_layouts.get(layout_path)
+        if pending is not None:
+            return pending
+        try:
+            return await asyncio.to_thread(_read_json, layout_path)
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail=f"Layout not found: {name}")
-        with open(layout_path) as f:
-            return json.load(f)
 
     @app.post("/api/layouts/{name}")
     async def save_layout(name: str, update: LayoutUpdate) -> dict[str, Any]:
-        """Save a layout."""
+        """Save a layout.
+
+        The editor saves after every change, so writes are deferred and
+        coalesced; the file is written within LAYOUT_FLUSH_SECONDS, before
+        the layout is loaded, and on shutdown.
+        """
+        nonlocal flush_timer
         layouts_dir = display_manager.config_dir / "layouts"
         layouts_dir.mkdir(parents=True, exist_ok=True)
         layout_path = layouts_dir / f"{name}.json"
-        # Atomic write
-        temp_path = layout_path.with_suffix(".tmp")
-        with open(temp_path, "w") as f:
-            json.dump(update.layout, f, indent=2)
-        temp_path.rename(layout_path)
+        pending_layouts[layout_path] = update.layout
+        if flush_timer is None:
+            flush_timer = asyncio.get_running_loop().call_later(LAYOUT_FLUSH_SECONDS, on_flush_timer)
         return {"success": True, "path": str(layout_path)}
 
     @app.delete("/api/layouts/{name}")
     async def delete_layout(name: str) -> dict[str, Any]:
         """Delete a layout."""
         layout_path = display_manager.config_dir / "layouts" / f"{name}.json"
-        if not layout_path.exists():
-            raise HTTPException(status_code=404, detail=f"Layout not found: {name}")
-        layout_path.unlink()
+        async with layout_write_lock:
+            was_pending = pending_layouts.pop(layout_path, None) is not None
+            if not layout_path.exists():
+                if was_pending:
+                    return {"success": True}
+                raise HTTPException(status_code=404, detail=f"Layout not found: {name}")
+            layout_path.unlink()
         return {"success": True}
 
     @app.post("/api/layout/load/{name}")
     async def load_layout(name: str) -> dict[str, Any]:
         """Load and activate a layout."""
         layout_path = display_manager.config_dir / "layouts" / f"{name}.json"
+        await flush_layouts(layout_path)
         if not display_manager.load_layout(layout_path):
             raise HTTPException(status_code=400, detail=f"Failed to load layout: {name}")
-        display_manager._render_and_send()
+        await asyncio.to_thread(display_manager._render_and_send)
         return {"success": True, "layout": name}
 
     @app.post("/api/layout/new")
@@ -182,7 +401,7 @@ def create_app(display_manager: Any) -> FastAPI:
         layouts_dir = display_manager.config_dir / "layouts"
         layouts_dir.mkdir(parents=True, exist_ok=True)
         layout_path = layouts_dir / f"{request.name}.json"
-        if layout_path.exists():
+        if layout_path in pending_layouts or layout_path.exists():
             raise HTTPException(status_code=400, detail=f"Layout already exists: {request.name}")
         new_layout = {
             "name": request.name,
@@ -190,8 +409,7 @@ def create_app(display_manager: Any) -> FastAPI:
             "refresh_seconds": 300,
             "widgets": []
         }
-        with open(layout_path, "w") as f:
-            json.dump(new_layout, f, indent=2)
+        await asyncio.to_thread(_write_json, layout_path, new_layout)
         return {"success": True, "layout": new_layout}
 
     # --- Widget APIs ---
@@ -213,10 +431,12 @@ def create_app(display_manager: Any) -> FastAPI:
 
         # Save and reload
         layout_path = display_manager.config_dir / "layouts" / f"{display_manager.layout.name}.json"
-        with open(layout_path, "w") as f:
-            json.dump(layout_data, f, indent=2)
+        async with layout_write_lock:
+            # Supersedes any deferred save of this layout
+            pending_layouts.pop(layout_path, None)
+            await asyncio.to_thread(_write_json, layout_path, layout_data)
         display_manager.load_layout(layout_path)
-        display_manager._render_and_send()
+        await asyncio.to_thread(display_manager._render_and_send)
 
         return {"success": True, "widget_id": widget["id"], "layout": layout_data}
 
@@ -241,10 +461,12 @@ def create_app(display_manager: Any) -> FastAPI:
 
         # Save and reload
         layout_path = display_manager.config_dir / "layouts" / f"{display_manager.layout.name}.json"
-        with open(layout_path, "w") as f:
-            json.dump(layout_data, f, indent=2)
+        async with layout_write_lock:
+            # Supersedes any deferred save of this layout
+            pending_layouts.pop(layout_path, None)
+            await asyncio.to_thread(_write_json, layout_path, layout_data)
         display_manager.load_layout(layout_path)
-        display_manager._render_and_send()
+        await asyncio.to_thread(display_manager._render_and_send)
 
         return {"success": True, "layout": layout_data}
 
@@ -264,41 +486,56 @@ def create_app(display_manager: Any) -> FastAPI:
 
         # Save and reload
         layout_path = display_manager.config_dir / "layouts" / f"{display_manager.layout.name}.json"
-        with open(layout_path, "w") as f:
-            json.dump(layout_data, f, indent=2)
+        async with layout_write_lock:
+            # Supersedes any deferred save of this layout
+            pending_layouts.pop(layout_path, None)
+            await asyncio.to_thread(_write_json, layout_path, layout_data)
         display_manager.load_layout(layout_path)
-        display_manager._render_and_send()
+        await asyncio.to_thread(display_manager._render_and_send)
 
         return {"success": True, "layout": layout_data}
 
     # --- Preview APIs ---
 
     @app.get("/api/preview")
-    async def get_preview() -> Response:
-        """Get current frame as PNG image."""
-        frame = display_manager.render()
-        if not frame:
+    async def get_preview(
+        request: Request,
+        scale: int = Query(default=1, ge=1, le=MAX_PREVIEW_SCALE),
+    ) -> Response:
+        """Get current frame as PNG image, optionally upscaled.
+
+        Clients that list image/webp in Accept get the native-size frame as
+        lossless WebP instead, which is about half the size of the PNG
+        (upscaled WebPs are not reliably smaller, so those stay PNG). The
+        ETag is derived from the image, so a client polling an unchanged
+        display revalidates with If-None-Match and gets an empty 304.
+        """
+        rgb = display_manager.render_bytes()
+        if rgb is None:
             raise HTTPException(status_code=404, detail="No frame available")
-        img = frame.to_image()
-        img = img.resize((256, 256), resample=0)
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        buffer.seek(0)
-        return Response(content=buffer.getvalue(), media_type="image/png")
+        webp = (
+            WEBP_SUPPORTED
+            and scale == 1
+            and "image/webp" in request.headers.get("accept", "")
+        )
+        image_format = "WEBP" if webp else "PNG"
+        etag = _preview_etag(rgb, scale, image_format)
+        headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept"}
+        if etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=headers)
+        return Response(
+            content=_preview_image(rgb, scale, image_format),
+            media_type=f"image/{image_format.lower()}",
+            headers=headers,
+        )
 
     @app.get("/api/preview/base64")
     async def get_preview_base64() -> dict[str, str]:
-        """Get current frame as base64-encoded PNG."""
-        frame = display_manager.render()
-        if not frame:
+        """Get current frame as a base64 image data URI."""
+        rgb = display_manager.render_bytes()
+        if rgb is None:
             raise HTTPException(status_code=404, detail="No frame available")
-        img = frame.to_image()
-        img = img.resize((256, 256), resample=0)
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        buffer.seek(0)
-        b64 = base64.b64encode(buffer.getvalue()).decode("ascii")
-        return {"image": f"data:image/png;base64,{b64}"}
+        return {"image": _preview_data_uri(rgb)}
 
     @app.post("/api/preview/render")
     async def render_preview(update: LayoutUpdate) -> dict[str, str]:
@@ -306,14 +543,8 @@ def create_app(display_manager: Any) -> FastAPI:
         from divoom_client.models.layout import Layout
         try:
             layout = Layout.model_validate(update.layout)
-            frame = display_manager._renderer.render(layout, display_manager._last_data or {})
-            img = frame.to_image()
-            img = img.resize((256, 256), resample=0)
-            buffer = io.BytesIO()
-            img.save(buffer, format="PNG")
-            buffer.seek(0)
-            b64 = base64.b64encode(buffer.getvalue()).decode("ascii")
-            return {"image": f"data:image/png;base64,{b64}"}
+            rgb = await asyncio.to_thread(render_layout_preview, layout)
+            return {"image": _preview_data_uri(rgb)}
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
 
@@ -324,7 +555,7 @@ def create_app(display_manager: Any) -> FastAPI:
         """Send current frame to device."""
         if not display_manager.device:
             raise HTTPException(status_code=400, detail="No device connected")
-        if display_manager.send_to_device():
+        if await asyncio.to_thread(display_manager.send_to_device):
             return {"success": True}
         else:
             raise HTTPException(status_code=500, detail="Failed to send to device")
@@ -336,7 +567,7 @@ def create_app(display_manager: Any) -> FastAPI:
             raise HTTPException(status_code=400, detail="No device connected")
         if level < 0 or level > 100:
             raise HTTPException(status_code=400, detail="Brightness must be 0-100")
-        display_manager.device.set_brightness(level)
+        await asyncio.to_thread(display_manager._call_device, "set_brightness", level)
         return {"success": True, "brightness": level}
 
     @app.get("/api/device/info")
@@ -345,7 +576,7 @@ def create_app(display_manager: Any) -> FastAPI:
         if not display_manager.device:
             raise HTTPException(status_code=400, detail="No device connected")
         try:
-            info = display_manager.device.get_device_info()
+            info = await asyncio.to_thread(display_manager._call_device, "get_device_info")
             return {"success": True, "info": info}
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
@@ -355,7 +586,7 @@ def create_app(display_manager: Any) -> FastAPI:
         """Turn screen on or off."""
         if not display_manager.device:
             raise HTTPException(status_code=400, detail="No device connected")
-        display_manager.device.set_screen_on(request.on)
+        await asyncio.to_thread(display_manager._call_device, "set_screen_on", request.on)
         return {"success": True, "power": request.on}
 
     @app.post("/api/device/channel/{channel}")
@@ -365,7 +596,7 @@ def create_app(display_manager: Any) -> FastAPI:
             raise HTTPException(status_code=400, detail="No device connected")
         if channel < 0 or channel > 4:
             raise HTTPException(status_code=400, detail="Channel must be 0-4")
-        display_manager.device.set_channel(channel)
+        await asyncio.to_thread(display_manager._call_device, "set_channel", channel)
         return {"success": True, "channel": channel}
 
     @app.post("/api/device/reconnect")
@@ -388,7 +619,7 @@ def create_app(display_manager: Any) -> FastAPI:
         if not display_manager.device:
             return {"connected": False}
         try:
-            display_manager.device.get_device_info()
+            await asyncio.to_thread(display_manager._call_device, "get_device_info")
             return {"connected": True, "ip": display_manager.device.ip_address}
         except Exception:
             return {"connected": False}
@@ -398,7 +629,7 @@ def create_app(display_manager: Any) -> FastAPI:
         """Scan network for Pixoo devices."""
         from divoom_client.core.discovery import scan_network
         try:
-            devices = scan_network()
+            devices = await asyncio.to_thread(scan_network)
             return {"devices": devices, "count": len(devices)}
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
@@ -409,7 +640,7 @@ def create_app(display_manager: Any) -> FastAPI:
         from divoom_client.core.discovery import save_device_config
         from divoom_client.models.config import DeviceConfig
         try:
-            display_manager.connect(ip)
+            await asyncio.to_thread(display_manager.connect, ip)
             config = DeviceConfig(ip_address=ip)
             config_path = display_manager.config_dir / "device.json"
             save_device_config(config, config_path)
@@ -538,7 +769,7 @@ def create_app(display_manager: Any) -> FastAPI:
             raise HTTPException(status_code=404, detail=f"Data source not found: {name}")
 
         try:
-            data = await source.refresh()
+            data = await source.refresh(force=True)
             return {"success": True, "data": data}
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -565,6 +796,9 @@ def create_app(display_manager: Any) -> FastAPI:
         with open(config_path, "w") as f:
             json.dump(config, f, indent=2)
 
+        if display_manager._data_manager.get_source(name):
+            display_manager._data_manager.set_enabled(name, not current)
+
         return {"success": True, "enabled": not current}
 
     # --- Quick Action APIs ---
@@ -593,7 +827,8 @@ def create_app(display_manager: Any) -> FastAPI:
             x_offset += font.width + font.spacing
 
         # Send to device
-        display_manager.device.send_pixels(frame.to_pixels())
+        if not await asyncio.to_thread(display_manager._send_rgb, frame.to_bytes()):
+            raise HTTPException(status_code=500, detail="Failed to send to device")
 
         return {"success": True}
 
@@ -608,34 +843,42 @@ def create_app(display_manager: Any) -> FastAPI:
             img = Image.open(io.BytesIO(contents))
             img = img.convert("RGB")
             img = img.resize((64, 64), resample=Image.Resampling.NEAREST)
-            display_manager.device.send_image(img)
-            return {"success": True}
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
+        if not await asyncio.to_thread(display_manager._send_rgb, img.tobytes()):
+            raise HTTPException(status_code=500, detail="Failed to send to device")
+        return {"success": True}
 
     @app.get("/api/quick/presets")
     async def list_presets() -> list[str]:
         """List available layout presets."""
-        layouts_dir = display_manager.config_dir / "layouts"
-        if not layouts_dir.exists():
-            return []
-        return sorted([p.stem for p in layouts_dir.glob("*.json")])
+        names = await asyncio.to_thread(_list_layout_names, display_manager.config_dir / "layouts")
+        return sorted(set(names).union(p.stem for p in pending_layouts))
 
     @app.post("/api/quick/preset/{name}")
     async def activate_preset(name: str) -> dict[str, Any]:
         """Activate a preset layout."""
         layout_path = display_manager.config_dir / "layouts" / f"{name}.json"
+        await flush_layouts(layout_path)
         if not display_manager.load_layout(layout_path):
             raise HTTPException(status_code=400, detail=f"Failed to load preset: {name}")
-        display_manager._render_and_send()
+        await asyncio.to_thread(display_manager._render_and_send)
         return {"success": True, "preset": name}
 
     # --- Web UI ---
 
     @app.get("/", response_class=HTMLResponse)
-    async def index() -> str:
-        """Serve the main web UI."""
-        return get_index_html()
+    async def index(request: Request) -> Response:
+        """Serve the main web UI.
+
+        The page only changes with the package, so browsers revalidate it
+        with If-None-Match and get an empty 304 when it is unchanged.
+        """
+        etag = _index_etag()
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=headers)
+        return HTMLResponse(content=_index_html_bytes(), headers=headers)
 
     return app
 
@@ -1492,9 +1735,14 @@ def get_index_html() -> str:
 
         async function refreshPreview() {
             try {
-                const res = await fetch('/api/preview/base64');
-                const data = await res.json();
-                document.getElementById('preview').src = data.image;
+                // Raw image; the browser revalidates it by ETag and reuses
+                // its cached copy when the display has not changed
+                const res = await fetch('/api/preview', {headers: {Accept: 'image/webp,image/png'}});
+                if (!res.ok) throw new Error('HTTP ' + res.status);
+                const img = document.getElementById('preview');
+                const previous = img.src;
+                img.src = URL.createObjectURL(await res.blob());
+                if (previous.startsWith('blob:')) URL.revokeObjectURL(previous);
             } catch (e) {
                 log('Failed to refresh preview: ' + e, 'error');
             }